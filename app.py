@@ -15,13 +15,13 @@ from backend import (
     get_processing_status,
     reset_storage,
     reprocess_file,
-    create_initial_file_record,
+    create_initial_file_records,
     get_file_results,
     reset_stuck_processing_files,
     delete_file_record
 )
 import json
-from config import LOGS_VOLUME_PATH
+from config import LOGS_VOLUME_PATH, PIPELINE_MAX_WORKERS, UC_LOG_EXTENSION
 
 # Page configuration
 st.set_page_config(
@@ -439,6 +439,10 @@ if "viewing_results_file_id" not in st.session_state:
 if "show_trace_info" not in st.session_state:
     st.session_state.show_trace_info = False
 
+# Keyset cursors (created_at, file_id) of the status table pages viewed so far; empty = newest page
+if "status_page_cursors" not in st.session_state:
+    st.session_state.status_page_cursors = []
+
 # Check for query parameters to trigger results dialog or reprocess
 query_params = st.query_params
 if "view_results" in query_params:
@@ -490,11 +494,18 @@ elif "delete" in query_params:
 # Configurable table row limit
 TABLE_ROW_LIMIT = int(os.environ.get("TABLE_ROW_LIMIT", "20"))
 
+def current_status_cursor():
+    """(created_before, before_file_id) cursor of the status table page being viewed ((None, None) = newest)"""
+    cursors = st.session_state.status_page_cursors
+    return cursors[-1] if cursors else (None, None)
+
 # Cache the status query to reduce SQL calls
 @st.cache_data(ttl=30)
-def fetch_processing_status():
+def fetch_processing_status(created_before=None, before_file_id=None):
     try:
-        return get_processing_status(limit=TABLE_ROW_LIMIT)
+        return get_processing_status(
+            limit=TABLE_ROW_LIMIT, created_before=created_before, before_file_id=before_file_id
+        )
     except Exception as e:
         return {"files": [], "error": str(e)}
 
@@ -509,14 +520,14 @@ if "initial_load_complete" not in st.session_state:
     """, unsafe_allow_html=True)
 
     # Fetch processing status
-    status_data = fetch_processing_status()
+    status_data = fetch_processing_status(*current_status_cursor())
 
     # Mark initial load as complete and clear loading indicator
     st.session_state.initial_load_complete = True
     loading_placeholder.empty()
 else:
     # Subsequent loads - fetch without loading indicator
-    status_data = fetch_processing_status()
+    status_data = fetch_processing_status(*current_status_cursor())
 
 # Header with gradient styling - compact version
 st.markdown("""
@@ -707,7 +718,10 @@ def render_status_table(placeholder):
     """Render the status table into the given placeholder"""
     # Fetch fresh data (bypass cache during processing or reprocessing)
     if st.session_state.is_processing or st.session_state.reprocessing_file_id:
-        fresh_status = get_processing_status(limit=TABLE_ROW_LIMIT)
+        created_before, before_file_id = current_status_cursor()
+        fresh_status = get_processing_status(
+            limit=TABLE_ROW_LIMIT, created_before=created_before, before_file_id=before_file_id
+        )
         # Also update sidebar stage counts
         sidebar_stages_placeholder.markdown(render_sidebar_stages(fresh_status), unsafe_allow_html=True)
     else:
@@ -772,7 +786,9 @@ def render_status_table(placeholder):
                             log_schema = log_parts[2]
                             log_volume = log_parts[3]
                             subpath = '/'.join(log_parts[4:]) if len(log_parts) > 4 else ''
-                            log_filename = f"{subpath}/{date_str}/{file_id}.log" if subpath else f"{date_str}/{file_id}.log"
+                            log_filename = f"{date_str}/{file_id}{UC_LOG_EXTENSION}"
+                            if subpath:
+                                log_filename = f"{subpath}/{log_filename}"
                             log_file_url = f"{databricks_host}/explore/data/volumes/{log_catalog}/{log_schema}/{log_volume}?o={workspace_id}&filePreviewPath={log_filename}"
                     except Exception:
                         pass
@@ -882,6 +898,21 @@ def render_status_table(placeholder):
 # Initial render of status table
 render_status_table(status_table_placeholder)
 
+# Status table paging: each page starts after the last (created_at, file_id) of the previous one
+page_files = status_data.get("files") or []
+newer_col, page_col, older_col = st.columns([1, 2, 1])
+with newer_col:
+    if st.button("← Newer", key="status_newer_btn", disabled=not st.session_state.status_page_cursors):
+        st.session_state.status_page_cursors.pop()
+        st.rerun()
+with page_col:
+    st.caption(f"Page {len(st.session_state.status_page_cursors) + 1}")
+with older_col:
+    if st.button("Older →", key="status_older_btn", disabled=len(page_files) < TABLE_ROW_LIMIT):
+        last_file = page_files[-1]
+        st.session_state.status_page_cursors.append((last_file["created_at"], last_file["file_id"]))
+        st.rerun()
+
 
 # Trace Structure Info Dialog - shows visual representation of MLflow trace hierarchy
 @st.dialog("MLflow Trace Structure", width="large")
@@ -1006,8 +1037,12 @@ def show_results_dialog(file_id: str, filename: str):
             deidentify_result = None
             parse_error = None
 
-            # Try multiple parsing strategies
-            for attempt in range(3):
+            # JSONB column: psycopg already returns the decoded dict
+            if isinstance(deidentify_result_str, dict):
+                deidentify_result = deidentify_result_str
+
+            # Try multiple parsing strategies (results stored as TEXT before the JSONB migration)
+            for attempt in range(3 if deidentify_result is None else 0):
                 try:
                     if attempt == 0:
                         # First try: clean control characters
@@ -1159,11 +1194,8 @@ if st.session_state.is_processing and st.session_state.files_to_process:
         </style>
         """, unsafe_allow_html=True)
 
-        # Create initial records for all files first
-        file_ids = []
-        for file_info in files_to_process:
-            file_id = create_initial_file_record(file_info["name"])
-            file_ids.append(file_id)
+        # Create initial records for all files first (single batched insert)
+        file_ids = create_initial_file_records([file_info["name"] for file_info in files_to_process])
 
         # Refresh table to show all files as "Processing (ingest)"
         render_status_table(status_table_placeholder)
@@ -1197,7 +1229,8 @@ if st.session_state.is_processing and st.session_state.files_to_process:
                 return {"status": "failed", "error": str(e)}
 
         # Process files in parallel with ThreadPoolExecutor
-        max_workers = min(4, total_files)  # Limit concurrent processing
+        # Per-stage concurrency is capped in the backend (STAGE_CONCURRENCY_*)
+        max_workers = min(PIPELINE_MAX_WORKERS, total_files)
 
         with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
             # Submit all files for processing
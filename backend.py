@@ -7,8 +7,10 @@ Uses mlflow.start_span context managers - parent trace contains 5 child spans (o
 
 import time
 import uuid
+import threading
+from contextlib import ExitStack, contextmanager
 from datetime import datetime
-from typing import Dict, Any
+from typing import Dict, Any, List
 import mlflow
 import os
 import logging
@@ -23,10 +25,10 @@ from stages import (
 )
 
 # Import storage
-from storage import ProcessingStatusTable, ResultsTable
+from storage import ProcessingStatusTable, ResultsTable, UploadsTable, ParseCacheTable, ExtractCacheTable
 
 # Import config
-from config import MLFLOW_EXPERIMENT_NAME, VOLUME_CONFIG, print_config, TEST_FORCE_FAILURE_STAGE
+from config import MLFLOW_EXPERIMENT_NAME, VOLUME_CONFIG, print_config, TEST_FORCE_FAILURE_STAGE, STAGE_CONCURRENCY
 
 # Import logging utilities
 from utils.uc_logger import setup_pipeline_logging, cleanup_pipeline_logging
@@ -54,6 +56,66 @@ print_config()
 # Lazy initialization for tables (avoid blocking on import)
 _status_table = None
 _results_table = None
+_uploads_table = None
+_parse_cache_table = None
+_extract_cache_table = None
+
+# Per-stage concurrency limits shared by all pipeline threads in this process
+_stage_slots = {
+    stage: threading.BoundedSemaphore(max(limit, 1))
+    for stage, limit in STAGE_CONCURRENCY.items()
+}
+
+
+@contextmanager
+def _stage_slot(stage_name: str):
+    """Hold one of the stage's concurrency slots while the stage runs"""
+    slot = _stage_slots[stage_name]
+    slot.acquire()
+    try:
+        yield
+    finally:
+        slot.release()
+
+
+@contextmanager
+def _pipeline_log_scope(uc_log_handler):
+    """Clean up a run's pipeline logging when the block exits, including on errors"""
+    try:
+        yield
+    finally:
+        cleanup_pipeline_logging(uc_log_handler)
+
+
+@contextmanager
+def _pipelined_stage_writes(table):
+    """
+    Run the status/result writes that follow a stage on one pinned connection
+
+    The status and results tables share the Lakebase connection manager, so the
+    writes in the block reuse one pipelined connection. Each write still commits
+    on its own, so a failed result upsert cannot undo the status change. Like the
+    individual writes, a connection failure is logged rather than raised: if no
+    connection can be pinned, the block runs unpinned (each write on its own
+    pooled connection). Errors raised by the block itself propagate unchanged.
+    """
+    if table is None:
+        yield
+        return
+
+    pinned = ExitStack()
+    try:
+        pinned.enter_context(table.conn_manager.pipelined())
+    except Exception as e:
+        logger.warning(f"Could not pin a connection for stage writes, writing unpinned: {e}")
+
+    try:
+        yield
+    finally:
+        try:
+            pinned.close()
+        except Exception as e:
+            logger.warning(f"Could not write stage status/results: {e}")
 
 
 def _check_test_failure(stage_name: str):
@@ -84,6 +146,39 @@ def get_results_table():
             logger.warning(f"[BACKEND] Could not initialize results table: {e}")
     return _results_table
 
+def get_uploads_table():
+    """Get uploads (content-hash dedupe) table with lazy initialization"""
+    global _uploads_table
+    if _uploads_table is None:
+        try:
+            _uploads_table = UploadsTable()
+            logger.info("[BACKEND] Uploads table initialized")
+        except Exception as e:
+            logger.warning(f"[BACKEND] Could not initialize uploads table: {e}")
+    return _uploads_table
+
+def get_parse_cache_table():
+    """Get parse cache table with lazy initialization"""
+    global _parse_cache_table
+    if _parse_cache_table is None:
+        try:
+            _parse_cache_table = ParseCacheTable()
+            logger.info("[BACKEND] Parse cache table initialized")
+        except Exception as e:
+            logger.warning(f"[BACKEND] Could not initialize parse cache table: {e}")
+    return _parse_cache_table
+
+def get_extract_cache_table():
+    """Get extract cache table with lazy initialization"""
+    global _extract_cache_table
+    if _extract_cache_table is None:
+        try:
+            _extract_cache_table = ExtractCacheTable()
+            logger.info("[BACKEND] Extract cache table initialized")
+        except Exception as e:
+            logger.warning(f"[BACKEND] Could not initialize extract cache table: {e}")
+    return _extract_cache_table
+
 
 def create_initial_file_record(filename: str) -> str:
     """
@@ -97,26 +192,37 @@ def create_initial_file_record(filename: str) -> str:
     Returns:
         The generated file_id (pipeline_id)
     """
-    pipeline_id = str(uuid.uuid4())
+    return create_initial_file_records([filename])[0]
+
+
+def create_initial_file_records(filenames: List[str]) -> List[str]:
+    """
+    Create initial file records for a whole upload batch in one write.
+
+    Records are inserted directly in "processing" status so the UI shows every
+    file in the table immediately.
+
+    Args:
+        filenames: Original filenames
+
+    Returns:
+        The generated file_ids (pipeline_ids), in the same order as filenames
+    """
+    pipeline_ids = [str(uuid.uuid4()) for _ in filenames]
 
     status_table = get_status_table()
-    if status_table:
+    if status_table and filenames:
         try:
-            status_table.insert_file_record(
-                file_id=pipeline_id,
-                filename=filename
-            )
-            # Update to show "processing" status immediately
-            status_table.update_file_status(
-                file_id=pipeline_id,
+            status_table.insert_file_records_bulk(
+                [(pipeline_id, filename, None) for pipeline_id, filename in zip(pipeline_ids, filenames)],
                 status="processing",
                 current_stage="ingest"
             )
-            logger.info(f"[BACKEND] Created initial record for {filename} with id {pipeline_id}")
+            logger.info(f"[BACKEND] Created initial records for {len(filenames)} files")
         except Exception as e:
-            logger.warning(f"Could not create initial record: {e}")
+            logger.warning(f"Could not create initial records: {e}")
 
-    return pipeline_id
+    return pipeline_ids
 
 
 def process_file_through_pipeline(
@@ -154,8 +260,8 @@ def process_file_through_pipeline(
     if uc_log_handler and uc_log_handler.file_path:
         logger.info(f"[PIPELINE {pipeline_id}] Logs will be written to: {uc_log_handler.file_path}")
 
-    # Start trace with metadata only (no file_bytes)
-    with mlflow.start_span(
+    # Start trace with metadata only (no file_bytes); pipeline logging is cleaned up on exit
+    with _pipeline_log_scope(uc_log_handler), mlflow.start_span(
         name="process_file_pipeline",
         span_type="CHAIN",
         attributes={
@@ -211,13 +317,15 @@ def process_file_through_pipeline(
             logger.info(f"[PIPELINE {pipeline_id}] Stage 1: Ingest")
             if on_stage_status:
                 on_stage_status("ingest", "processing")
-            ingest_result = ingest_file(
-                file_bytes=file_bytes,
-                filename=filename,
-                catalog=catalog,
-                schema=schema,
-                volume_name=volume_name
-            )
+            with _stage_slot("ingest"):
+                ingest_result = ingest_file(
+                    file_bytes=file_bytes,
+                    filename=filename,
+                    catalog=catalog,
+                    schema=schema,
+                    volume_name=volume_name,
+                    uploads_table=get_uploads_table()
+                )
             results["stages"]["ingest"] = ingest_result
             _check_test_failure("ingest")
 
@@ -261,24 +369,19 @@ def process_file_through_pipeline(
                 except Exception as e:
                     logger.warning(f"Could not update status: {e}")
 
-            # Create result record after ingest (initial row for all stage results)
+            # Result record is created by the first stage result upsert (parse)
             results_table = get_results_table()
-            if results_table:
-                try:
-                    results_table.create_result_record(
-                        file_id=pipeline_id,
-                        trace_id=trace_id,
-                        experiment_id=exp.experiment_id,
-                        source_volume_path=volume_path
-                    )
-                except Exception as e:
-                    logger.warning(f"Could not create result record: {e}")
 
             # Stage 2: Parse - Extract text and structure
             logger.info(f"[PIPELINE {pipeline_id}] Stage 2: Parse")
             if on_stage_status:
                 on_stage_status("parse", "processing")
-            parse_result = parse_document(volume_path=volume_path)
+            with _stage_slot("parse"):
+                parse_result = parse_document(
+                    volume_path=volume_path,
+                    file_hash=ingest_result.get("file_hash_sha256"),
+                    parse_cache=get_parse_cache_table()
+                )
             results["stages"]["parse"] = parse_result
             _check_test_failure("parse")
 
@@ -290,35 +393,41 @@ def process_file_through_pipeline(
             if on_stage_status:
                 on_stage_status("parse", "success")
 
-            # Update status
-            if status_table:
-                try:
-                    status_table.update_file_status(
-                        file_id=pipeline_id,
-                        current_stage="categorize",
-                        stage_parse_status="completed"
-                    )
-                    if on_stage_update:
-                        on_stage_update()
-                except Exception as e:
-                    logger.warning(f"Could not update status: {e}")
+            # Update status and store parse result (one pinned connection)
+            with _pipelined_stage_writes(status_table or results_table):
+                # Update status
+                if status_table:
+                    try:
+                        status_table.update_file_status(
+                            file_id=pipeline_id,
+                            current_stage="categorize",
+                            stage_parse_status="completed"
+                        )
+                    except Exception as e:
+                        logger.warning(f"Could not update status: {e}")
 
-            # Store parse result
-            if results_table:
-                try:
-                    results_table.update_stage_result(
-                        file_id=pipeline_id,
-                        stage_name="parse",
-                        result_data=parse_result
-                    )
-                except Exception as e:
-                    logger.warning(f"Could not store parse result: {e}")
+                # Store parse result
+                if results_table:
+                    try:
+                        results_table.update_stage_result(
+                            file_id=pipeline_id,
+                            stage_name="parse",
+                            result_data=parse_result,
+                            trace_id=trace_id,
+                            experiment_id=exp.experiment_id,
+                            source_volume_path=volume_path
+                        )
+                    except Exception as e:
+                        logger.warning(f"Could not store parse result: {e}")
+            if on_stage_update and status_table:
+                on_stage_update()
 
             # Stage 3: Categorize - Classify document
             logger.info(f"[PIPELINE {pipeline_id}] Stage 3: Categorize")
             if on_stage_status:
                 on_stage_status("categorize", "processing")
-            categorize_result = categorize_document(parsed_data=parse_result)
+            with _stage_slot("categorize"):
+                categorize_result = categorize_document(parsed_data=parse_result)
             results["stages"]["categorize"] = categorize_result
             _check_test_failure("categorize")
 
@@ -330,37 +439,43 @@ def process_file_through_pipeline(
             if on_stage_status:
                 on_stage_status("categorize", "success")
 
-            # Update status with primary_category
+            # Update status with primary_category and store categorize result (one pinned connection)
             primary_category = categorize_result.get("categorization", {}).get("primary_category")
-            if status_table:
-                try:
-                    status_table.update_file_status(
-                        file_id=pipeline_id,
-                        current_stage="extract",
-                        stage_categorize_status="completed",
-                        primary_category=primary_category
-                    )
-                    if on_stage_update:
-                        on_stage_update()
-                except Exception as e:
-                    logger.warning(f"Could not update status: {e}")
+            with _pipelined_stage_writes(status_table or results_table):
+                # Update status
+                if status_table:
+                    try:
+                        status_table.update_file_status(
+                            file_id=pipeline_id,
+                            current_stage="extract",
+                            stage_categorize_status="completed",
+                            primary_category=primary_category
+                        )
+                    except Exception as e:
+                        logger.warning(f"Could not update status: {e}")
 
-            # Store categorize result
-            if results_table:
-                try:
-                    results_table.update_stage_result(
-                        file_id=pipeline_id,
-                        stage_name="categorize",
-                        result_data=categorize_result
-                    )
-                except Exception as e:
-                    logger.warning(f"Could not store categorize result: {e}")
+                # Store categorize result
+                if results_table:
+                    try:
+                        results_table.update_stage_result(
+                            file_id=pipeline_id,
+                            stage_name="categorize",
+                            result_data=categorize_result
+                        )
+                    except Exception as e:
+                        logger.warning(f"Could not store categorize result: {e}")
+            if on_stage_update and status_table:
+                on_stage_update()
 
             # Stage 4: Extract - Extract entities
             logger.info(f"[PIPELINE {pipeline_id}] Stage 4: Extract")
             if on_stage_status:
                 on_stage_status("extract", "processing")
-            extract_result = extract_entities(categorized_data=categorize_result)
+            with _stage_slot("extract"):
+                extract_result = extract_entities(
+                    categorized_data=categorize_result,
+                    extract_cache=get_extract_cache_table()
+                )
             results["stages"]["extract"] = extract_result
             _check_test_failure("extract")
 
@@ -372,35 +487,38 @@ def process_file_through_pipeline(
             if on_stage_status:
                 on_stage_status("extract", "success")
 
-            # Update status
-            if status_table:
-                try:
-                    status_table.update_file_status(
-                        file_id=pipeline_id,
-                        current_stage="deidentify",
-                        stage_extract_status="completed"
-                    )
-                    if on_stage_update:
-                        on_stage_update()
-                except Exception as e:
-                    logger.warning(f"Could not update status: {e}")
+            # Update status and store extract result (one pinned connection)
+            with _pipelined_stage_writes(status_table or results_table):
+                # Update status
+                if status_table:
+                    try:
+                        status_table.update_file_status(
+                            file_id=pipeline_id,
+                            current_stage="deidentify",
+                            stage_extract_status="completed"
+                        )
+                    except Exception as e:
+                        logger.warning(f"Could not update status: {e}")
 
-            # Store extract result
-            if results_table:
-                try:
-                    results_table.update_stage_result(
-                        file_id=pipeline_id,
-                        stage_name="extract",
-                        result_data=extract_result
-                    )
-                except Exception as e:
-                    logger.warning(f"Could not store extract result: {e}")
+                # Store extract result
+                if results_table:
+                    try:
+                        results_table.update_stage_result(
+                            file_id=pipeline_id,
+                            stage_name="extract",
+                            result_data=extract_result
+                        )
+                    except Exception as e:
+                        logger.warning(f"Could not store extract result: {e}")
+            if on_stage_update and status_table:
+                on_stage_update()
 
             # Stage 5: De-identify - Remove PII
             logger.info(f"[PIPELINE {pipeline_id}] Stage 5: De-identify")
             if on_stage_status:
                 on_stage_status("deidentify", "processing")
-            deidentify_result = deidentify_document(extracted_data=extract_result)
+            with _stage_slot("deidentify"):
+                deidentify_result = deidentify_document(extracted_data=extract_result)
             results["stages"]["deidentify"] = deidentify_result
             _check_test_failure("deidentify")
 
@@ -412,40 +530,40 @@ def process_file_through_pipeline(
             if on_stage_status:
                 on_stage_status("deidentify", "success")
 
-            # Store deidentify result
-            if results_table:
-                try:
-                    results_table.update_stage_result(
-                        file_id=pipeline_id,
-                        stage_name="deidentify",
-                        result_data=deidentify_result
-                    )
-                except Exception as e:
-                    logger.warning(f"Could not store deidentify result: {e}")
-
             # Pipeline completion
             results["status"] = "completed"
             results["end_time"] = datetime.now().isoformat()
             results["total_time_seconds"] = time.time() - pipeline_start
             results["stages_completed"] = 5
 
-            # Mark as completed in status table
-            if status_table:
-                try:
-                    primary_category = categorize_result.get("categorization", {}).get("primary_category")
-                    entities_count = extract_result.get("entities_count", 0)
-                    pii_items_masked = deidentify_result.get("pii_items_masked", 0)
+            # Store deidentify result and mark as completed (one pinned connection)
+            with _pipelined_stage_writes(status_table or results_table):
+                if results_table:
+                    try:
+                        results_table.update_stage_result(
+                            file_id=pipeline_id,
+                            stage_name="deidentify",
+                            result_data=deidentify_result
+                        )
+                    except Exception as e:
+                        logger.warning(f"Could not store deidentify result: {e}")
 
-                    status_table.mark_completed(
-                        file_id=pipeline_id,
-                        primary_category=primary_category,
-                        entities_count=entities_count,
-                        pii_items_masked=pii_items_masked
-                    )
-                    if on_stage_update:
-                        on_stage_update()
-                except Exception as e:
-                    logger.warning(f"Could not mark as completed: {e}")
+                if status_table:
+                    try:
+                        primary_category = categorize_result.get("categorization", {}).get("primary_category")
+                        entities_count = extract_result.get("entities_count", 0)
+                        pii_items_masked = deidentify_result.get("pii_items_masked", 0)
+
+                        status_table.mark_completed(
+                            file_id=pipeline_id,
+                            primary_category=primary_category,
+                            entities_count=entities_count,
+                            pii_items_masked=pii_items_masked
+                        )
+                    except Exception as e:
+                        logger.warning(f"Could not mark as completed: {e}")
+            if on_stage_update and status_table:
+                on_stage_update()
 
             logger.info(f"[PIPELINE {pipeline_id}] Completed successfully in {results['total_time_seconds']:.2f}s")
 
@@ -507,19 +625,23 @@ def process_file_through_pipeline(
         except Exception as flush_err:
             logger.warning(f"[PIPELINE {pipeline_id}] Could not flush trace: {flush_err}")
 
-        # Clean up pipeline logging (flush logs to UC Volume)
-        cleanup_pipeline_logging(uc_log_handler)
-
         return results
 
 
-def get_processing_status(file_id: str = None, limit: int = 100) -> Dict[str, Any]:
+def get_processing_status(
+    file_id: str = None,
+    limit: int = 100,
+    created_before: datetime = None,
+    before_file_id: str = None
+) -> Dict[str, Any]:
     """
     Get processing status from Lakebase PostgreSQL table
 
     Args:
         file_id: Specific file ID (returns all if None)
         limit: Maximum records to return
+        created_before: Return the page of files listed after this timestamp
+        before_file_id: Last file_id of the previous page (tie-breaker for created_before)
 
     Returns:
         Dictionary with status records
@@ -541,7 +663,9 @@ def get_processing_status(file_id: str = None, limit: int = 100) -> Dict[str, An
             return result
         else:
             logger.info(f"Fetching all files with limit={limit}")
-            records = status_table.get_all_files(limit=limit)
+            records = status_table.get_all_files(
+                limit=limit, created_before=created_before, before_file_id=before_file_id
+            )
             logger.info(f"get_all_files returned {len(records)} records")
             if records:
                 logger.info(f"First record from get_all_files: {records[0]}")
@@ -615,8 +739,8 @@ def reprocess_file(file_id: str, volume_path: str, filename: str, failed_stage:
     if uc_log_handler and uc_log_handler.file_path:
         logger.info(f"[REPROCESS {file_id}] Logs will be written to: {uc_log_handler.file_path}")
 
-    # Start trace with metadata
-    with mlflow.start_span(
+    # Start trace with metadata; pipeline logging is cleaned up on exit
+    with _pipeline_log_scope(uc_log_handler), mlflow.start_span(
         name="reprocess_file_pipeline",
         span_type="CHAIN",
         attributes={
@@ -710,32 +834,19 @@ def reprocess_file(file_id: str, volume_path: str, filename: str, failed_stage:
         if start_index > 0 and results_table:
             # Load results from previous stages
             try:
-                import json
                 prev_results = results_table.get_results(file_id)
                 if prev_results:
-                    # Results are stored as JSON strings, need to parse them
+                    # JSONB columns are decoded to dicts by psycopg
                     if start_index > 0 and prev_results.get("parse_result"):
-                        parse_result_str = prev_results["parse_result"]
-                        if isinstance(parse_result_str, str):
-                            parse_result = json.loads(parse_result_str)
-                        else:
-                            parse_result = parse_result_str
+                        parse_result = prev_results["parse_result"]
                         results["stages"]["parse"] = parse_result
                         logger.info(f"[REPROCESS {file_id}] Loaded previous parse result")
                     if start_index > 1 and prev_results.get("categorize_result"):
-                        categorize_result_str = prev_results["categorize_result"]
-                        if isinstance(categorize_result_str, str):
-                            categorize_result = json.loads(categorize_result_str)
-                        else:
-                            categorize_result = categorize_result_str
+                        categorize_result = prev_results["categorize_result"]
                         results["stages"]["categorize"] = categorize_result
                         logger.info(f"[REPROCESS {file_id}] Loaded previous categorize result")
                     if start_index > 2 and prev_results.get("extract_result"):
-                        extract_result_str = prev_results["extract_result"]
-                        if isinstance(extract_result_str, str):
-                            extract_result = json.loads(extract_result_str)
-                        else:
-                            extract_result = extract_result_str
+                        extract_result = prev_results["extract_result"]
                         results["stages"]["extract"] = extract_result
                         logger.info(f"[REPROCESS {file_id}] Loaded previous extract result")
             except Exception as e:
@@ -866,7 +977,8 @@ def reprocess_file(file_id: str, volume_path: str, filename: str, failed_stage:
             # Stage 2: Parse - Extract text and structure
             if start_index <= 0:
                 logger.info(f"[REPROCESS {file_id}] Stage 2: Parse")
-                parse_result = parse_document(volume_path=volume_path)
+                with _stage_slot("parse"):
+                    parse_result = parse_document(volume_path=volume_path)
                 results["stages"]["parse"] = parse_result
                 _check_test_failure("parse")
 
@@ -902,7 +1014,8 @@ def reprocess_file(file_id: str, volume_path: str, filename: str, failed_stage:
             # Stage 3: Categorize - Classify document
             if start_index <= 1:
                 logger.info(f"[REPROCESS {file_id}] Stage 3: Categorize")
-                categorize_result = categorize_document(parsed_data=parse_result)
+                with _stage_slot("categorize"):
+                    categorize_result = categorize_document(parsed_data=parse_result)
                 results["stages"]["categorize"] = categorize_result
                 _check_test_failure("categorize")
 
@@ -940,7 +1053,8 @@ def reprocess_file(file_id: str, volume_path: str, filename: str, failed_stage:
             # Stage 4: Extract - Extract entities
             if start_index <= 2:
                 logger.info(f"[REPROCESS {file_id}] Stage 4: Extract")
-                extract_result = extract_entities(categorized_data=categorize_result)
+                with _stage_slot("extract"):
+                    extract_result = extract_entities(categorized_data=categorize_result)
                 results["stages"]["extract"] = extract_result
                 _check_test_failure("extract")
 
@@ -975,7 +1089,8 @@ def reprocess_file(file_id: str, volume_path: str, filename: str, failed_stage:
 
             # Stage 5: De-identify - Remove PII
             logger.info(f"[REPROCESS {file_id}] Stage 5: De-identify")
-            deidentify_result = deidentify_document(extracted_data=extract_result)
+            with _stage_slot("deidentify"):
+                deidentify_result = deidentify_document(extracted_data=extract_result)
             results["stages"]["deidentify"] = deidentify_result
             _check_test_failure("deidentify")
 
@@ -1077,9 +1192,6 @@ def reprocess_file(file_id: str, volume_path: str, filename: str, failed_stage:
         except Exception as flush_err:
             logger.warning(f"[REPROCESS {file_id}] Could not flush trace: {flush_err}")
 
-        # Clean up pipeline logging
-        cleanup_pipeline_logging(uc_log_handler)
-
         return results
 
 
@@ -1108,25 +1220,22 @@ def reset_stuck_processing_files() -> Dict[str, Any]:
         return {"error": "Status table not available", "reset_count": 0}
 
     try:
-        # Get all files with status='processing'
-        all_files = status_table.get_all_files(limit=1000)
-        stuck_files = [f for f in all_files if f.get("status") == "processing"]
+        # Get all files with status='processing' (served by the partial status index)
+        stuck_files = status_table.get_all_files(limit=1000, status="processing")
 
-        reset_count = 0
+        failures = []
         for file_record in stuck_files:
             file_id = file_record.get("file_id")
             current_stage = file_record.get("current_stage", "unknown")
-
-            try:
-                status_table.mark_failed(
-                    file_id=file_id,
-                    error_message=f"Processing interrupted by app restart (was at stage: {current_stage})",
-                    current_stage=current_stage
-                )
-                reset_count += 1
-                logger.info(f"Reset stuck file {file_id} (was at {current_stage})")
-            except Exception as e:
-                logger.warning(f"Could not reset file {file_id}: {e}")
+            failures.append((
+                file_id,
+                f"Processing interrupted by app restart (was at stage: {current_stage})",
+                current_stage
+            ))
+            logger.info(f"Resetting stuck file {file_id} (was at {current_stage})")
+
+        # Single pipelined batch instead of one round trip per file
+        reset_count = status_table.mark_failed_many(failures) if failures else 0
 
         logger.info(f"Reset {reset_count} stuck processing files")
         return {"reset_count": reset_count, "status": "success"}
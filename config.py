@@ -45,6 +45,10 @@ MLFLOW_EXPERIMENT_NAME = os.environ.get(
     "/Shared/unstructured_parsequery_pipeline"
 )
 
+# Per-stage child spans (set MLFLOW_TRACING=0 to skip them for bulk runs;
+# the file-level pipeline trace is always recorded)
+MLFLOW_TRACING_ENABLED = os.environ.get("MLFLOW_TRACING", "1") == "1"
+
 
 # ============================================================================
 # AI Query Prompts Configuration
@@ -69,15 +73,7 @@ Taxonomy Categories:
 - Compliance Document: Regulatory filings, audit reports, KYC documents, risk assessments
 - Contract Agreement: Service agreements, purchase agreements, terms and conditions
 
-Respond in JSON format with:
-{{
-  "primary_category": "category name",
-  "primary_confidence": 0.XX,
-  "primary_justification": "brief explanation",
-  "secondary_category": "category name",
-  "secondary_confidence": 0.XX,
-  "secondary_justification": "brief explanation"
-}}
+Confidence scores are between 0 and 1. Justifications are brief explanations.
 """
 
 # Stage 4: Extract Entities - Default prompt
@@ -101,16 +97,7 @@ Entity Types to Extract:
 - credit_score: Credit scores, credit ratings
 - property: Property descriptions, real estate addresses
 
-Respond in JSON format with:
-{{
-  "entities": [
-    {{
-      "type": "entity_type",
-      "value": "extracted value",
-      "confidence": 0.XX
-    }}
-  ]
-}}
+Confidence scores are between 0 and 1.
 """
 
 # Stage 5: De-identify - Default prompt
@@ -139,20 +126,11 @@ For each PII item found, provide:
 1. The type of PII
 2. The value to be masked
 3. The replacement strategy (REDACT, MASK, GENERALIZE)
-
-Respond in JSON format with:
-{{
-  "pii_items": [
-    {{
-      "type": "pii_type",
-      "value": "original value",
-      "strategy": "REDACT|MASK|GENERALIZE",
-      "replacement": "replacement value or pattern"
-    }}
-  ]
-}}
+4. The replacement value or pattern
 """
 
+# Output shape is enforced with structured output (see stages/schemas.py), so the
+# prompts only describe the task, not the JSON format.
 # Allow prompts to be overridden via environment variables
 CATEGORIZE_PROMPT = os.environ.get("CATEGORIZE_PROMPT", CATEGORIZE_PROMPT_DEFAULT)
 EXTRACT_PROMPT = os.environ.get("EXTRACT_PROMPT", EXTRACT_PROMPT_DEFAULT)
@@ -175,6 +153,50 @@ RESULTS_TABLE_NAME = os.environ.get(
     "unstructured_parsequery.results"
 )
 
+# Lakebase PostgreSQL table mapping file content hash -> uploaded volume path
+UPLOADS_TABLE_NAME = os.environ.get(
+    "UPLOADS_TABLE_NAME",
+    "unstructured_parsequery.uploads"
+)
+
+# Lakebase PostgreSQL table caching ai_parse_document output by file content hash
+PARSE_CACHE_TABLE_NAME = os.environ.get(
+    "PARSE_CACHE_TABLE_NAME",
+    "unstructured_parsequery.parse_cache"
+)
+
+# Lakebase PostgreSQL table caching extract_entities output by normalized document text
+EXTRACT_CACHE_TABLE_NAME = os.environ.get(
+    "EXTRACT_CACHE_TABLE_NAME",
+    "unstructured_parsequery.extract_cache"
+)
+# Cached extractions older than this are ignored and recomputed
+EXTRACT_CACHE_TTL_HOURS = int(os.environ.get("EXTRACT_CACHE_TTL_HOURS", "168"))
+
+# Lakebase connection pool sizing (shared by all tables in the app process)
+LAKEBASE_POOL_MIN_SIZE = int(os.environ.get("LAKEBASE_POOL_MIN_SIZE", "2"))
+LAKEBASE_POOL_MAX_SIZE = int(os.environ.get("LAKEBASE_POOL_MAX_SIZE", "20"))
+# Idle pooled connections above min size are closed after this many seconds
+LAKEBASE_POOL_MAX_IDLE = float(os.environ.get("LAKEBASE_POOL_MAX_IDLE", "300"))
+# Pooled connections are replaced after this many seconds (kept below the ~1h OAuth token lifetime)
+LAKEBASE_POOL_MAX_LIFETIME = float(os.environ.get("LAKEBASE_POOL_MAX_LIFETIME", "1800"))
+
+# Server-side prepared statements for repeated table SQL: a statement is prepared
+# once it has run LAKEBASE_PREPARE_THRESHOLD times on a connection, and each
+# connection keeps up to LAKEBASE_PREPARED_MAX of them (LRU). Disabled when
+# connecting through a transaction-pooling PgBouncer, which can't track them.
+LAKEBASE_PGBOUNCER = os.environ.get("LAKEBASE_PGBOUNCER", "false").lower() == "true"
+LAKEBASE_PREPARE_THRESHOLD = None if LAKEBASE_PGBOUNCER else int(os.environ.get("LAKEBASE_PREPARE_THRESHOLD", "1"))
+LAKEBASE_PREPARED_MAX = int(os.environ.get("LAKEBASE_PREPARED_MAX", "64"))
+
+# Commit progress/result writes (status updates, stage results) without waiting for
+# the WAL flush. A crash can lose the last few of them; the file is simply reprocessed.
+# Record creation and completion stay durable.
+LAKEBASE_ASYNC_COMMIT = os.environ.get("LAKEBASE_ASYNC_COMMIT", "true").lower() == "true"
+
+# Skip CREATE SCHEMA/TABLE/INDEX checks at startup (set when DDL is applied by migration)
+SKIP_SCHEMA_CHECK = os.environ.get("SKIP_SCHEMA_CHECK", "0") == "1"
+
 # UC Volume path for pipeline logs
 # LOGS_VOLUME_PATH comes from app resource (base volume path)
 # We append the app name and logs subdirectory
@@ -186,6 +208,35 @@ else:
     # Fallback default
     LOGS_VOLUME_PATH = f"{VOLUME_PATH}/logs" if VOLUME_PATH else "/Volumes/catalog/schema/volume/logs"
 
+# Pipeline log batching: buffered log lines are uploaded to the volume once any
+# threshold is reached (and on close), bounding memory and lost logs on a crash
+UC_LOG_BATCH_BYTES = int(os.environ.get("UC_LOG_BATCH_BYTES", str(256 * 1024)))
+UC_LOG_BATCH_RECORDS = int(os.environ.get("UC_LOG_BATCH_RECORDS", "500"))
+UC_LOG_BATCH_MS = int(os.environ.get("UC_LOG_BATCH_MS", "2000"))
+# Max log records kept per pipeline; on overflow the oldest records are dropped
+UC_LOG_RING_MAX = int(os.environ.get("UC_LOG_RING_MAX", "50000"))
+# Max log records waiting for the pipeline log listener thread; when full (e.g.
+# the Files API stalls) new records are dropped and counted instead of queued
+UC_LOG_QUEUE_MAX = int(os.environ.get("UC_LOG_QUEUE_MAX", "100000"))
+# Upload pipeline logs gzip-compressed as {pipeline_id}.log.gz (far fewer bytes
+# uploaded/stored, but the volume file preview can't display them)
+UC_LOG_GZIP = os.environ.get("UC_LOG_GZIP", "false").lower() == "true"
+# File extension for pipeline log files
+UC_LOG_EXTENSION = ".log.gz" if UC_LOG_GZIP else ".log"
+
+# Parallel processing settings
+# Files are processed in a thread pool of PIPELINE_MAX_WORKERS; each stage additionally
+# caps how many files may be inside it at once, so a slow stage (e.g. parse on the SQL
+# warehouse) doesn't stop other files from progressing through the faster stages
+PIPELINE_MAX_WORKERS = int(os.environ.get("PIPELINE_MAX_WORKERS", "16"))
+STAGE_CONCURRENCY = {
+    "ingest": int(os.environ.get("STAGE_CONCURRENCY_INGEST", "8")),
+    "parse": int(os.environ.get("STAGE_CONCURRENCY_PARSE", "4")),
+    "categorize": int(os.environ.get("STAGE_CONCURRENCY_CATEGORIZE", "16")),
+    "extract": int(os.environ.get("STAGE_CONCURRENCY_EXTRACT", "16")),
+    "deidentify": int(os.environ.get("STAGE_CONCURRENCY_DEIDENTIFY", "16"))
+}
+
 # File processing settings
 MAX_FILE_SIZE_MB = int(os.environ.get("MAX_FILE_SIZE_MB", "100"))
 SUPPORTED_FILE_TYPES = [".pdf", ".docx", ".txt", ".html", ".md"]
@@ -196,6 +247,9 @@ AI_QUERY_ENDPOINT = os.environ.get("AI_QUERY_ENDPOINT")
 AI_QUERY_MODEL = AI_QUERY_ENDPOINT or os.environ.get("AI_QUERY_MODEL", "databricks-gpt-5-1")
 AI_QUERY_TEMPERATURE = float(os.environ.get("AI_QUERY_TEMPERATURE", "0.0"))
 AI_QUERY_MAX_TOKENS = int(os.environ.get("AI_QUERY_MAX_TOKENS", "5000"))
+# Input token budget for the entity extraction prompt (template + document text).
+# The default leaves ~1.25k document tokens, about what the old 5000-character slice sent.
+AI_QUERY_MAX_INPUT_TOKENS = int(os.environ.get("AI_QUERY_MAX_INPUT_TOKENS", "1700"))
 
 # Databricks serving endpoint base URL
 DATABRICKS_HOST = os.environ.get("DATABRICKS_HOST", "https://your-workspace.cloud.databricks.com")
@@ -245,6 +299,9 @@ def print_config():
     print(f"\nMLflow Experiment: {MLFLOW_EXPERIMENT_NAME}")
     print(f"Status Table: {STATUS_TABLE_NAME}")
     print(f"Results Table: {RESULTS_TABLE_NAME}")
+    print(f"Uploads Table: {UPLOADS_TABLE_NAME}")
+    print(f"Parse Cache Table: {PARSE_CACHE_TABLE_NAME}")
+    print(f"Extract Cache Table: {EXTRACT_CACHE_TABLE_NAME}")
     print(f"Logs Volume Path: {LOGS_VOLUME_PATH}")
     print(f"Max File Size: {MAX_FILE_SIZE_MB} MB")
     print(f"AI Model: {AI_QUERY_MODEL}")
@@ -7,6 +7,7 @@ Contains individual stage modules:
 - categorize: Document categorization with ai_query
 - extract: Entity extraction with ai_query
 - deidentify: PII removal with ai_query
+- schemas: Structured output schemas for the ai_query stages
 """
 
 from .ingest import ingest_file
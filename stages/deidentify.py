@@ -5,13 +5,12 @@ Uses Databricks AI Query API with configurable prompts to identify and mask PII.
 Includes MLflow tracing for observability.
 """
 
-import mlflow
 from datetime import datetime
 from typing import Dict, Any
 import logging
-import json
 import os
 from openai import OpenAI
+from pydantic import ValidationError
 from config import (
     DEIDENTIFY_PROMPT,
     AI_QUERY_MODEL,
@@ -19,7 +18,8 @@ from config import (
     AI_QUERY_MAX_TOKENS,
     DATABRICKS_BASE_URL
 )
-from utils import get_databricks_token
+from utils import get_databricks_token, start_span
+from stages.schemas import PIIItemsOut, PII_ITEMS_RESPONSE_FORMAT
 
 logger = logging.getLogger(__name__)
 
@@ -50,8 +50,9 @@ def deidentify_document(
         document_text = "\n\n".join([
             page.get("text", "") for page in extracted_data["pages"]
         ])
+    text_length = len(document_text)
 
-    with mlflow.start_span(
+    with start_span(
         name="stage_5_deidentify",
         span_type="LLM",
         attributes={"stage": "deidentify", "model": model_used}
@@ -60,11 +61,11 @@ def deidentify_document(
         span.set_inputs({
             "prompt_template": prompt_template_used[:200] + "..." if len(prompt_template_used) > 200 else prompt_template_used,
             "model": model_used,
-            "document_text_length": len(document_text)
+            "document_text_length": text_length
         })
 
         try:
-            logger.info(f"De-identifying document with {len(document_text)} characters")
+            logger.info(f"De-identifying document with {text_length} characters")
 
             # Format prompt with document text
             prompt = prompt_template_used.format(document_text=document_text[:5000])  # Limit to 5000 chars
@@ -86,7 +87,8 @@ def deidentify_document(
                     }
                 ],
                 temperature=AI_QUERY_TEMPERATURE,
-                max_tokens=AI_QUERY_MAX_TOKENS
+                max_tokens=AI_QUERY_MAX_TOKENS,
+                response_format=PII_ITEMS_RESPONSE_FORMAT
             )
 
             # Set LLM attributes on span for observability
@@ -97,12 +99,13 @@ def deidentify_document(
             span.set_attribute("total_tokens", response.usage.total_tokens)
             span.set_attribute("finish_reason", response.choices[0].finish_reason)
 
-            # Parse JSON response
-            response_text = response.choices[0].message.content
+            # Parse structured JSON response
+            response_text = response.choices[0].message.content or ""
             try:
-                deidentify_result = json.loads(response_text)
-            except json.JSONDecodeError:
-                logger.warning(f"Failed to parse JSON response, using as-is: {response_text}")
+                # Parse and validate against the schema in one step
+                deidentify_result = PIIItemsOut.model_validate_json(response_text).model_dump()
+            except ValidationError:
+                logger.warning(f"Response did not match schema, using as-is: {response_text}")
                 # Fallback to empty PII items if parsing fails
                 deidentify_result = {
                     "pii_items": [],
@@ -5,29 +5,129 @@ Uses Databricks AI Query API with configurable prompts to extract entities.
 Includes MLflow tracing for observability.
 """
 
-import mlflow
 from datetime import datetime
 from typing import Dict, Any
 import logging
-import json
 import os
+import re
+import time
+import hashlib
+from functools import lru_cache
+import tiktoken
 from openai import OpenAI
+from pydantic import ValidationError
 from config import (
     EXTRACT_PROMPT,
     AI_QUERY_MODEL,
     AI_QUERY_TEMPERATURE,
     AI_QUERY_MAX_TOKENS,
+    AI_QUERY_MAX_INPUT_TOKENS,
     DATABRICKS_BASE_URL
 )
-from utils import get_databricks_token
+from utils import get_databricks_token, start_span
+from stages.schemas import EntitiesOut, ENTITIES_RESPONSE_FORMAT
 
 logger = logging.getLogger(__name__)
 
+# Tokens reserved for chat formatting overhead on top of the rendered prompt
+_PROMPT_OVERHEAD_TOKENS = 256
+
+# Rough characters per token, used when no tokenizer is available
+_CHARS_PER_TOKEN = 4
+# Seconds before retrying a failed tokenizer load (model -> time.monotonic() of the failure)
+_ENCODING_RETRY_S = 300
+_encoding_failed_at = {}
+
+# Page numbering that varies between otherwise identical renderings of a document
+_PAGE_NUMBER_RE = re.compile(r"\bpage\s+\d+(?:\s+of\s+\d+)?\b", re.IGNORECASE)
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+def _extract_cache_key(document_text: str, prompt_template: str, model: str):
+    """
+    Build the extraction cache key from normalized text, prompt and model
+
+    Normalization drops "page N of M" markers and collapses whitespace, so
+    near-identical re-ingests of a document map to the same key. Case is kept:
+    documents differing only in case (names, IDs) must not share extractions.
+
+    Returns:
+        Tuple of (cache key, prompt hash)
+    """
+    normalized = _WHITESPACE_RE.sub(" ", _PAGE_NUMBER_RE.sub(" ", document_text)).strip()
+    prompt_hash = hashlib.sha256(prompt_template.encode("utf-8")).hexdigest()
+    key = hashlib.sha256(
+        "\x00".join((model, prompt_hash, normalized)).encode("utf-8")
+    ).hexdigest()
+    return key, prompt_hash
+
+
+@lru_cache(maxsize=8)
+def _load_encoding(model: str):
+    """
+    Load (and cache) the tiktoken encoding for a model, falling back to cl100k_base
+
+    Raises on load failure, so only successfully loaded encodings are cached.
+    """
+    try:
+        return tiktoken.encoding_for_model(model)
+    except KeyError:
+        return tiktoken.get_encoding("cl100k_base")
+
+
+def _get_encoding(model: str):
+    """
+    Get the tiktoken encoding for a model, or None if it can't be loaded
+
+    tiktoken downloads its BPE file on first use, which fails when the app has no
+    egress. After a failure the load is retried once _ENCODING_RETRY_S has passed,
+    so a transient error doesn't pin the process to the character estimate.
+    """
+    failed_at = _encoding_failed_at.get(model)
+    if failed_at is not None and time.monotonic() - failed_at < _ENCODING_RETRY_S:
+        return None
+    try:
+        encoding = _load_encoding(model)
+    except Exception as e:
+        _encoding_failed_at[model] = time.monotonic()
+        logger.warning(f"Could not load tiktoken encoding, truncating by characters instead: {e}")
+        return None
+    _encoding_failed_at.pop(model, None)
+    return encoding
+
+
+def _truncate_to_token_budget(document_text: str, prompt_template: str, model: str):
+    """
+    Truncate document text so the rendered prompt fits AI_QUERY_MAX_INPUT_TOKENS
+
+    Without a tokenizer, tokens are estimated at _CHARS_PER_TOKEN characters each.
+
+    Returns:
+        Tuple of (truncated text, document token budget, document tokens before truncation)
+    """
+    enc = _get_encoding(model)
+    template = prompt_template.format(document_text="")
+
+    if enc is None:
+        template_tokens = len(template) // _CHARS_PER_TOKEN
+        budget = max(AI_QUERY_MAX_INPUT_TOKENS - template_tokens - _PROMPT_OVERHEAD_TOKENS, 0)
+        return document_text[:budget * _CHARS_PER_TOKEN], budget, len(document_text) // _CHARS_PER_TOKEN
+
+    # Documents may contain literal special-token text such as "<|endoftext|>": encode it as plain text
+    template_tokens = len(enc.encode(template, disallowed_special=()))
+    budget = max(AI_QUERY_MAX_INPUT_TOKENS - template_tokens - _PROMPT_OVERHEAD_TOKENS, 0)
+
+    ids = enc.encode(document_text, disallowed_special=())
+    if len(ids) <= budget:
+        return document_text, budget, len(ids)
+    return enc.decode(ids[:budget]), budget, len(ids)
+
 
 def extract_entities(
     categorized_data: Dict[str, Any],
     prompt_template: str = None,
-    model: str = None
+    model: str = None,
+    extract_cache=None
 ) -> Dict[str, Any]:
     """
     Extract entities from document using Databricks AI Query API
@@ -36,6 +136,7 @@ def extract_entities(
         categorized_data: Categorized document data from stage 3
         prompt_template: Custom prompt template (uses config default if None)
         model: Model to use for extraction (uses config default if None)
+        extract_cache: Optional ExtractCacheTable; on a hit the LLM is not called
 
     Returns:
         Dictionary with extracted entities
@@ -50,8 +151,9 @@ def extract_entities(
         document_text = "\n\n".join([
             page.get("text", "") for page in categorized_data["pages"]
         ])
+    text_length = len(document_text)
 
-    with mlflow.start_span(
+    with start_span(
         name="stage_4_extract",
         span_type="RETRIEVER",
         attributes={"stage": "extract", "model": model_used}
@@ -60,54 +162,79 @@ def extract_entities(
         span.set_inputs({
             "prompt_template": prompt_template_used[:200] + "..." if len(prompt_template_used) > 200 else prompt_template_used,
             "model": model_used,
-            "document_text_length": len(document_text)
+            "document_text_length": text_length
         })
 
         try:
-            logger.info(f"Extracting entities from document with {len(document_text)} characters")
-
-            # Format prompt with document text
-            prompt = prompt_template_used.format(document_text=document_text[:5000])  # Limit to 5000 chars
+            logger.info(f"Extracting entities from document with {text_length} characters")
 
-            # Call Databricks AI Query using OpenAI client
-            # Get OAuth token using client credentials (automatically injected by Databricks Apps)
-            token = get_databricks_token()
-            client = OpenAI(
-                api_key=token,
-                base_url=DATABRICKS_BASE_URL
+            # Fit document text to the input token budget (not a fixed character slice)
+            truncated_text, token_budget, document_tokens = _truncate_to_token_budget(
+                document_text, prompt_template_used, model_used
             )
+            span.set_attribute("document_tokens", document_tokens)
+            span.set_attribute("document_token_budget", token_budget)
+            if document_tokens > token_budget:
+                logger.info(f"Truncated document from {document_tokens} to {token_budget} tokens")
+
+            # Reuse a previous extraction of the same (normalized) text, prompt and model
+            cache_key, prompt_hash = _extract_cache_key(truncated_text, prompt_template_used, model_used)
+            extraction_result = extract_cache.get_extraction(cache_key) if extract_cache else None
+            cache_hit = extraction_result is not None
+            span.set_attribute("extract_cache_hit", cache_hit)
+
+            if cache_hit:
+                logger.info(f"Extract cache hit for key {cache_key[:12]}, skipping AI Query")
+            else:
+                # Format prompt with document text
+                prompt = prompt_template_used.format(document_text=truncated_text)
 
-            response = client.chat.completions.create(
-                model=model_used,
-                messages=[
-                    {
-                        "role": "user",
-                        "content": prompt
+                # Call Databricks AI Query using OpenAI client
+                # Get OAuth token using client credentials (automatically injected by Databricks Apps)
+                token = get_databricks_token()
+                client = OpenAI(
+                    api_key=token,
+                    base_url=DATABRICKS_BASE_URL
+                )
+
+                response = client.chat.completions.create(
+                    model=model_used,
+                    messages=[
+                        {
+                            "role": "user",
+                            "content": prompt
+                        }
+                    ],
+                    temperature=AI_QUERY_TEMPERATURE,
+                    max_tokens=AI_QUERY_MAX_TOKENS,
+                    response_format=ENTITIES_RESPONSE_FORMAT
+                )
+
+                # Set LLM attributes on span for observability
+                span.set_attribute("request_id", response.id)
+                span.set_attribute("model", response.model)
+                span.set_attribute("prompt_tokens", response.usage.prompt_tokens)
+                span.set_attribute("completion_tokens", response.usage.completion_tokens)
+                span.set_attribute("total_tokens", response.usage.total_tokens)
+                span.set_attribute("finish_reason", response.choices[0].finish_reason)
+                logger.info(f"Extract prompt_tokens: {response.usage.prompt_tokens} (document budget: {token_budget})")
+
+                # Parse structured JSON response
+                response_text = response.choices[0].message.content or ""
+                try:
+                    # Parse and validate against the schema in one step
+                    extraction_result = EntitiesOut.model_validate_json(response_text).model_dump()
+                except ValidationError:
+                    logger.warning(f"Response did not match schema, using as-is: {response_text}")
+                    # Fallback to empty entities if parsing fails
+                    extraction_result = {
+                        "entities": [],
+                        "raw_response": response_text[:200]
                     }
-                ],
-                temperature=AI_QUERY_TEMPERATURE,
-                max_tokens=AI_QUERY_MAX_TOKENS
-            )
 
-            # Set LLM attributes on span for observability
-            span.set_attribute("request_id", response.id)
-            span.set_attribute("model", response.model)
-            span.set_attribute("prompt_tokens", response.usage.prompt_tokens)
-            span.set_attribute("completion_tokens", response.usage.completion_tokens)
-            span.set_attribute("total_tokens", response.usage.total_tokens)
-            span.set_attribute("finish_reason", response.choices[0].finish_reason)
-
-            # Parse JSON response
-            response_text = response.choices[0].message.content
-            try:
-                extraction_result = json.loads(response_text)
-            except json.JSONDecodeError:
-                logger.warning(f"Failed to parse JSON response, using as-is: {response_text}")
-                # Fallback to empty entities if parsing fails
-                extraction_result = {
-                    "entities": [],
-                    "raw_response": response_text[:200]
-                }
+                # Only cache well-formed responses
+                if extract_cache and "raw_response" not in extraction_result:
+                    extract_cache.store_extraction(cache_key, model_used, prompt_hash, extraction_result)
 
             # Set outputs for trace (only extraction results, not pages/parsed_doc/categorization)
             span.set_outputs({
@@ -122,6 +249,7 @@ def extract_entities(
                 "entities_count": len(extraction_result.get("entities", [])),
                 "entities_extracted": len(extraction_result.get("entities", [])),
                 "model_used": model_used,
+                "cache_hit": cache_hit,
                 "timestamp": datetime.now().isoformat()
             }
 
@@ -8,15 +8,33 @@ Includes MLflow tracing for observability.
 import os
 import re
 import requests
-import mlflow
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import hashlib
 from datetime import datetime
 from typing import Dict, Any
 import logging
-from utils import get_databricks_token
+from utils import get_databricks_token, start_span
 
 logger = logging.getLogger(__name__)
 
+# Shared HTTP session for Files API uploads: keeps TLS connections alive between
+# uploads and retries transient throttling/server errors with backoff
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(
+    pool_connections=10,
+    pool_maxsize=50,
+    max_retries=Retry(
+        total=5,
+        backoff_factor=0.5,
+        status_forcelist=[429, 500, 502, 503, 504],
+        allowed_methods=["PUT", "GET", "HEAD"]
+    )
+))
+
+# Characters replaced in the name part (Unicode word characters and hyphens are kept)
+_UNSAFE_NAME_CHARS = re.compile(r'[^\w\-]')
+
 
 def sanitize_filename(filename: str) -> str:
     """
@@ -32,22 +50,46 @@ def sanitize_filename(filename: str) -> str:
     filename = filename.replace(' ', '_')
     # Remove or replace special characters but keep extension
     name, ext = os.path.splitext(filename)
-    # Keep only alphanumeric, underscores, hyphens
-    name = re.sub(r'[^\w\-]', '_', name)
+    # Keep only alphanumeric (including non-ASCII letters), underscores, hyphens
+    name = _UNSAFE_NAME_CHARS.sub('_', name)
     return f"{name}{ext}"
 
 
+def _volume_file_exists(workspace_url: str, token: str, volume_path: str) -> bool:
+    """
+    Check that a file is still present in the UC volume (Files API metadata request)
+
+    Any response other than 200 (or a request error) counts as missing, so the
+    caller uploads the bytes again rather than reusing a stale path.
+    """
+    try:
+        response = _SESSION.head(
+            f"{workspace_url}/api/2.0/fs/files{volume_path}",
+            headers={'Authorization': f'Bearer {token}'},
+            timeout=(5, 30)
+        )
+        return response.status_code == 200
+    except requests.exceptions.RequestException as e:
+        logger.warning(f"Could not check volume file {volume_path}: {e}")
+        return False
+
+
 def ingest_file(
     file_bytes: bytes,
     filename: str,
     catalog: str,
     schema: str,
     volume_name: str,
-    overwrite: bool = True
+    overwrite: bool = True,
+    uploads_table=None
 ) -> Dict[str, Any]:
     """
     Upload file to Unity Catalog volume using App Service Principal authentication.
 
+    If an uploads table is provided, the SHA-256 content hash is used as a dedupe
+    key: bytes that were already uploaded to the same target path (and are still
+    in the volume) are not sent again and that path is returned with cache_hit=True.
+
     Args:
         file_bytes: File content as bytes
         filename: Original filename
@@ -55,6 +97,7 @@ def ingest_file(
         schema: UC schema name
         volume_name: UC volume name
         overwrite: Whether to overwrite existing files
+        uploads_table: Optional UploadsTable used to skip re-uploading identical files
 
     Returns:
         Dictionary with upload status and metadata
@@ -62,7 +105,7 @@ def ingest_file(
     # Use context manager to avoid logging file_bytes in trace
     file_size_bytes = len(file_bytes)
 
-    with mlflow.start_span(
+    with start_span(
         name="stage_1_ingest",
         span_type="CHAIN",
         attributes={
@@ -93,10 +136,6 @@ def ingest_file(
             safe_filename = sanitize_filename(filename)
             logger.info(f"Sanitized filename: {filename} -> {safe_filename}")
 
-            # Construct volume file path
-            volume_file_path = f"/Volumes/{catalog}/{schema}/{volume_name}/{safe_filename}"
-            logger.info(f"Target volume path: {volume_file_path}")
-
             # Get App SP OAuth token (retrieved INSIDE traced function to avoid logging in trace)
             token = get_databricks_token()
 
@@ -105,16 +144,61 @@ def ingest_file(
             if not workspace_url.startswith('http'):
                 workspace_url = f"https://{workspace_url}"
 
+            # Construct volume file path
+            volume_file_path = f"/Volumes/{catalog}/{schema}/{volume_name}/{safe_filename}"
+            logger.info(f"Target volume path: {volume_file_path}")
+
+            # Skip the upload entirely if these exact bytes are already at this file's own
+            # path. Bytes recorded under another filename are uploaded again: that path
+            # can be overwritten later, and this file's rows must keep pointing at its
+            # own copy (the parse cache, keyed by hash, still skips re-parsing).
+            # The file may also have been removed from the volume since it was recorded.
+            existing_upload = uploads_table.get_upload(file_hash) if uploads_table else None
+            existing_path = existing_upload.get("volume_path") if existing_upload else None
+            if existing_path and existing_path != volume_file_path:
+                logger.info(f"Identical file was uploaded under another name ({existing_path}), uploading to own path")
+                existing_path = None
+            if existing_path and not _volume_file_exists(workspace_url, token, existing_path):
+                logger.info(f"Previously uploaded file is missing from the volume, uploading again: {existing_path}")
+                existing_path = None
+            if existing_path:
+                logger.info(f"Identical file already uploaded, skipping upload: {existing_path}")
+
+                span.set_attribute("cache_hit", True)
+                span.set_outputs({
+                    "status": "success",
+                    "volume_path": existing_path,
+                    "safe_filename": safe_filename,
+                    "size_bytes": file_size_bytes,
+                    "file_hash_sha256": file_hash,
+                    "cache_hit": True
+                })
+
+                return {
+                    "status": "success",
+                    "original_filename": filename,
+                    "safe_filename": safe_filename,
+                    "volume_path": existing_path,
+                    "size_bytes": file_size_bytes,
+                    "file_hash_sha256": file_hash,
+                    "cache_hit": True,
+                    "timestamp": datetime.now().isoformat(),
+                    "catalog": catalog,
+                    "schema": schema,
+                    "volume": volume_name
+                }
+
             # Construct Files API URL
             api_url = f"{workspace_url}/api/2.0/fs/files{volume_file_path}"
             logger.info(f"API URL: {api_url}")
 
-            # Upload file using PUT request with App SP token
-            response = requests.put(
+            # Upload file using PUT request with App SP token (connect timeout 5s, read timeout 300s)
+            response = _SESSION.put(
                 api_url,
                 data=file_bytes,
                 headers={'Authorization': f'Bearer {token}'},
-                params={'overwrite': 'true' if overwrite else 'false'}
+                params={'overwrite': 'true' if overwrite else 'false'},
+                timeout=(5, 300)
             )
 
             logger.info(f"Response status: {response.status_code}")
@@ -123,6 +207,14 @@ def ingest_file(
             if response.status_code in [200, 201, 204]:
                 logger.info(f"Upload successful!")
 
+                if uploads_table:
+                    uploads_table.record_upload(
+                        file_hash=file_hash,
+                        volume_path=volume_file_path,
+                        safe_filename=safe_filename,
+                        size_bytes=file_size_bytes
+                    )
+
                 result = {
                     "status": "success",
                     "original_filename": filename,
@@ -130,6 +222,7 @@ def ingest_file(
                     "volume_path": volume_file_path,
                     "size_bytes": len(file_bytes),
                     "file_hash_sha256": file_hash,
+                    "cache_hit": False,
                     "timestamp": datetime.now().isoformat(),
                     "catalog": catalog,
                     "schema": schema,
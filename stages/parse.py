@@ -6,47 +6,57 @@ Executes via SQL warehouse using statement execution API.
 Includes MLflow tracing for observability.
 """
 
-import mlflow
 from datetime import datetime
 from typing import Dict, Any
 import logging
 import uuid
 import time
+import orjson
 from databricks.sdk import WorkspaceClient
 from config import SQL_WAREHOUSE_ID, VOLUME_CONFIG
+from utils import start_span
 
 logger = logging.getLogger(__name__)
 
-
 def parse_document(
-    volume_path: str
+    volume_path: str,
+    include_raw_parsed: bool = False,
+    file_hash: str = None,
+    parse_cache=None
 ) -> Dict[str, Any]:
     """
     Parse document using Databricks ai_parse_document SQL function.
 
     Executes SQL statement via SQL warehouse to invoke ai_parse_document.
+    Only path and document_text are returned by default; the full `parsed`
+    VARIANT (often megabytes of JSON) is only fetched when explicitly requested.
 
     Args:
         volume_path: Full path to file in UC volume (e.g., /Volumes/catalog/schema/volume/file.pdf)
+        include_raw_parsed: Also return the full ai_parse_document output as parsed_doc
+        file_hash: SHA-256 of the source file (from ingest), used as the parse cache key
+        parse_cache: Optional ParseCacheTable; on a hit ai_parse_document is not called
 
     Returns:
         Dictionary with parsed content and metadata
     """
     # Use context manager to control what gets logged to trace (exclude large text content)
-    with mlflow.start_span(
+    with start_span(
         name="stage_2_parse",
         span_type="PARSER",
         attributes={
             "stage": "parse",
             "parser": "ai_parse_document",
             "volume_path": volume_path,
-            "sql_warehouse_id": SQL_WAREHOUSE_ID
+            "sql_warehouse_id": SQL_WAREHOUSE_ID,
+            "include_raw_parsed": include_raw_parsed
         }
     ) as span:
         # Set inputs for trace
         span.set_inputs({
             "volume_path": volume_path,
-            "parser": "ai_parse_document"
+            "parser": "ai_parse_document",
+            "include_raw_parsed": include_raw_parsed
         })
 
         try:
@@ -71,6 +81,41 @@ def parse_document(
             # Construct image output path (subdirectory in same volume)
             image_output_path = f"/Volumes/{catalog}/{schema}/{volume}/parsed_images/"
 
+            # Content-addressed cache: identical bytes always parse to the same output
+            cached = parse_cache.get_parse(file_hash) if parse_cache and file_hash else None
+            if cached and cached.get("document_text") and (not include_raw_parsed or cached.get("parsed_doc")):
+                document_text = cached["document_text"]
+                logger.info(f"Parse cache hit for hash {file_hash[:12]}, skipping ai_parse_document")
+
+                span.set_attribute("cache_hit", True)
+                pages = [{"text": document_text, "page_id": 0}]
+                text_length = len(document_text)
+                text_sample = document_text[:500] + "..." if text_length > 500 else document_text
+                span.set_outputs({
+                    "status": "success",
+                    "text_length": text_length,
+                    "text_sample": text_sample,
+                    "image_output_path": cached.get("image_output_path"),
+                    "pages_count": len(pages),
+                    "cache_hit": True
+                })
+
+                return {
+                    "status": "success",
+                    "volume_path": volume_path,
+                    "document_text": document_text,
+                    "pages": pages,
+                    "parsed_doc": cached.get("parsed_doc") if include_raw_parsed else None,
+                    "image_output_path": cached.get("image_output_path"),
+                    "statement_id": None,
+                    "cache_hit": True,
+                    "timestamp": datetime.now().isoformat()
+                }
+
+            # Only project the raw parsed VARIANT when the caller asks for it -
+            # downstream stages only need document_text
+            raw_parsed_column = ",\n              parsed" if include_raw_parsed else ""
+
             # Construct SQL query with ai_parse_document and extract text
             # Use SQL to parse the JSON structure and extract just the text content
             sql_query = f"""
@@ -94,8 +139,7 @@ def parse_document(
                   try_cast(parsed:document:elements AS ARRAY<VARIANT>),
                   element -> try_cast(element:content AS STRING)
                 )
-              ) AS document_text,
-              parsed
+              ) AS document_text{raw_parsed_column}
             FROM parsed_documents
             WHERE try_cast(parsed:error_status AS STRING) IS NULL
             """
@@ -147,7 +191,7 @@ def parse_document(
             logger.info(f"Got {len(stmt.result.data_array)} rows from ai_parse_document")
 
             # Extract results from SQL query
-            # SQL returns: path (column 0), document_text (column 1), parsed (column 2)
+            # SQL returns: path (column 0), document_text (column 1), parsed (column 2, only if requested)
             row = stmt.result.data_array[0]  # First row
             path = row[0] if len(row) > 0 else volume_path
             document_text = row[1] if len(row) > 1 else None
@@ -156,14 +200,14 @@ def parse_document(
             if not document_text:
                 raise Exception("No document text extracted from ai_parse_document")
 
-            logger.info(f"Extracted {len(document_text)} characters of text from document")
+            text_length = len(document_text)
+            logger.info(f"Extracted {text_length} characters of text from document")
 
-            # Parse the full ai_parse_document output for metadata (if needed)
-            import json as json_module
+            # Decode the full ai_parse_document output (only present when include_raw_parsed)
             parsed_doc_obj = None
             if parsed_doc:
                 if isinstance(parsed_doc, str):
-                    parsed_doc_obj = json_module.loads(parsed_doc)
+                    parsed_doc_obj = orjson.loads(parsed_doc)
                 else:
                     parsed_doc_obj = parsed_doc
 
@@ -180,14 +224,23 @@ def parse_document(
                 "parsed_doc": parsed_doc_obj,  # Full ai_parse_document output for reference
                 "image_output_path": image_output_path,
                 "statement_id": stmt.statement_id,
+                "cache_hit": False,
                 "timestamp": datetime.now().isoformat()
             }
 
+            if parse_cache and file_hash:
+                parse_cache.store_parse(
+                    file_hash=file_hash,
+                    document_text=document_text,
+                    image_output_path=image_output_path,
+                    parsed_doc=parsed_doc_obj
+                )
+
             # Set outputs for trace (include text sample for lineage, not full text)
-            text_sample = document_text[:500] + "..." if len(document_text) > 500 else document_text
+            text_sample = document_text[:500] + "..." if text_length > 500 else document_text
             span.set_outputs({
                 "status": "success",
-                "text_length": len(document_text),
+                "text_length": text_length,
                 "text_sample": text_sample,
                 "image_output_path": image_output_path,
                 "pages_count": len(pages)
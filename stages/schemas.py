@@ -0,0 +1,65 @@
+"""
+Structured output schemas for the AI Query stages
+
+Each LLM stage sends its schema as response_format (json_schema, strict) so the
+serving endpoint constrains generation to the expected shape, and validates the
+response with the same Pydantic model. JSON schemas are built once at import.
+"""
+
+from typing import List, Literal
+from pydantic import BaseModel, ConfigDict
+
+
+class _StrictModel(BaseModel):
+    """Base model emitting additionalProperties: false, as strict mode requires"""
+    model_config = ConfigDict(extra="forbid")
+
+
+# Stage 3: Categorize
+class CategorizationOut(_StrictModel):
+    primary_category: str
+    primary_confidence: float
+    primary_justification: str
+    secondary_category: str
+    secondary_confidence: float
+    secondary_justification: str
+
+
+# Stage 4: Extract Entities
+class Entity(_StrictModel):
+    type: str
+    value: str
+    confidence: float
+
+
+class EntitiesOut(_StrictModel):
+    entities: List[Entity]
+
+
+# Stage 5: De-identify
+class PIIItem(_StrictModel):
+    type: str
+    value: str
+    strategy: Literal["REDACT", "MASK", "GENERALIZE"]
+    replacement: str
+
+
+class PIIItemsOut(_StrictModel):
+    pii_items: List[PIIItem]
+
+
+def _response_format(name: str, model: type) -> dict:
+    """Build an OpenAI-compatible json_schema response_format for a model"""
+    return {
+        "type": "json_schema",
+        "json_schema": {
+            "name": name,
+            "schema": model.model_json_schema(),
+            "strict": True
+        }
+    }
+
+
+CATEGORIZATION_RESPONSE_FORMAT = _response_format("categorization_out", CategorizationOut)
+ENTITIES_RESPONSE_FORMAT = _response_format("entities_out", EntitiesOut)
+PII_ITEMS_RESPONSE_FORMAT = _response_format("pii_items_out", PIIItemsOut)
@@ -5,15 +5,24 @@ Contains storage modules:
 - lakebase_connection: Lakebase PostgreSQL connection manager
 - status_table: Processing status table (Lakebase PostgreSQL)
 - results_table: Pipeline results table (Lakebase PostgreSQL)
+- uploads_table: Content-hash upload dedupe table (Lakebase PostgreSQL)
+- parse_cache_table: Content-hash parse cache table (Lakebase PostgreSQL)
+- extract_cache_table: Normalized-text extraction cache table (Lakebase PostgreSQL)
 """
 
 from .lakebase_connection import get_connection_manager, LakebaseConnectionManager
 from .status_table import ProcessingStatusTable
 from .results_table import ResultsTable
+from .uploads_table import UploadsTable
+from .parse_cache_table import ParseCacheTable
+from .extract_cache_table import ExtractCacheTable
 
 __all__ = [
     "get_connection_manager",
     "LakebaseConnectionManager",
     "ProcessingStatusTable",
-    "ResultsTable"
+    "ResultsTable",
+    "UploadsTable",
+    "ParseCacheTable",
+    "ExtractCacheTable"
 ]
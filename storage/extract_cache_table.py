@@ -0,0 +1,117 @@
+"""
+Lakebase PostgreSQL Storage for Entity Extraction Cache
+
+Caches extract_entities output keyed by a hash of the normalized document text,
+the prompt template and the model, so re-ingested documents that differ only in
+whitespace, casing or page numbering reuse the previous extraction.
+"""
+
+import orjson
+import logging
+from datetime import datetime, timedelta
+from typing import Dict, Any, Optional
+from config import EXTRACT_CACHE_TABLE_NAME, EXTRACT_CACHE_TTL_HOURS
+from storage.lakebase_connection import get_connection_manager, ensure_simple_table
+
+logger = logging.getLogger(__name__)
+
+# CREATE TABLE column definitions
+_EXTRACT_CACHE_COLUMNS = """
+    cache_key TEXT PRIMARY KEY,
+    model TEXT,
+    prompt_hash TEXT,
+    extraction TEXT,
+    created_at TIMESTAMPTZ DEFAULT CURRENT_TIMESTAMP
+"""
+
+
+class ExtractCacheTable:
+    """
+    Manages the normalized-text keyed extraction cache in Lakebase PostgreSQL
+    """
+
+    def __init__(self, table_name: str = None, ttl_hours: int = None):
+        """
+        Initialize extract cache table manager
+
+        Args:
+            table_name: Table name (default from config)
+            ttl_hours: Maximum age of a usable cache entry (default from config)
+        """
+        self.table_name = table_name or EXTRACT_CACHE_TABLE_NAME
+        self.ttl = timedelta(hours=ttl_hours if ttl_hours is not None else EXTRACT_CACHE_TTL_HOURS)
+        self.conn_manager = get_connection_manager()
+        ensure_simple_table(self.conn_manager, self.table_name, _EXTRACT_CACHE_COLUMNS, "extract cache table")
+        logger.info(f"ExtractCacheTable initialized: {self.table_name}")
+
+    def get_extraction(self, cache_key: str) -> Optional[Dict[str, Any]]:
+        """
+        Get a cached extraction that is younger than the TTL
+
+        Args:
+            cache_key: Hash of normalized document text, prompt and model
+
+        Returns:
+            Extraction result dictionary, or None on miss/expired entry
+        """
+        try:
+            select_sql = f"""
+                SELECT extraction
+                FROM {self.table_name}
+                WHERE cache_key = %s AND created_at > %s
+            """
+
+            with self.conn_manager.connection() as conn:
+                with conn.cursor() as cur:
+                    cur.execute(select_sql, (cache_key, datetime.now().astimezone() - self.ttl))
+                    row = cur.fetchone()
+
+            if not row or not row[0]:
+                return None
+            return orjson.loads(row[0])
+
+        except Exception as e:
+            logger.error(f"Error getting cached extraction: {str(e)}", exc_info=True)
+            return None
+
+    def store_extraction(
+        self,
+        cache_key: str,
+        model: str,
+        prompt_hash: str,
+        extraction: Dict[str, Any]
+    ) -> bool:
+        """
+        Store an extraction result, replacing any previous (possibly expired) entry
+
+        Args:
+            cache_key: Hash of normalized document text, prompt and model
+            model: Model used for the extraction
+            prompt_hash: Hash of the prompt template used
+            extraction: Parsed extraction result
+
+        Returns:
+            True if successful, False otherwise
+        """
+        try:
+            upsert_sql = f"""
+                INSERT INTO {self.table_name}
+                (cache_key, model, prompt_hash, extraction, created_at)
+                VALUES (%s, %s, %s, %s, %s)
+                ON CONFLICT (cache_key) DO UPDATE SET
+                    extraction = EXCLUDED.extraction,
+                    created_at = EXCLUDED.created_at
+            """
+
+            with self.conn_manager.connection() as conn:
+                with conn.cursor() as cur:
+                    cur.execute(upsert_sql, (
+                        cache_key, model, prompt_hash, orjson.dumps(extraction).decode("utf-8"), datetime.now().astimezone()
+                    ))
+
+            logger.info(f"Cached extraction for key {cache_key[:12]}")
+            return True
+
+        except Exception as e:
+            logger.error(f"Failed to cache extraction: {str(e)}", exc_info=True)
+            return False
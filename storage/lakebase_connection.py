@@ -8,18 +8,62 @@ Uses environment variables automatically injected by Databricks Apps:
 
 import os
 import logging
-import psycopg2
-from databricks.sdk import WorkspaceClient
+import threading
+from contextlib import contextmanager
+from typing import Any, Callable, List, Optional, Sequence, Tuple
+import orjson
+import psycopg
+from psycopg.types.json import set_json_loads
+from psycopg_pool import ConnectionPool
+from config import (
+    LAKEBASE_POOL_MIN_SIZE,
+    LAKEBASE_POOL_MAX_SIZE,
+    LAKEBASE_POOL_MAX_IDLE,
+    LAKEBASE_POOL_MAX_LIFETIME,
+    LAKEBASE_PREPARE_THRESHOLD,
+    LAKEBASE_PREPARED_MAX,
+    LAKEBASE_ASYNC_COMMIT,
+    SKIP_SCHEMA_CHECK
+)
+from utils import get_databricks_token
 
 logger = logging.getLogger(__name__)
 
+# Decode json/jsonb columns (the results table stage results) with orjson instead of the stdlib parser.
+# The cache tables store JSON in TEXT columns and decode it with orjson themselves.
+set_json_loads(orjson.loads)
+
 # Singleton connection manager
 _connection_manager = None
 
+# Tables whose schema/table DDL has already run in this process
+_SCHEMA_READY = set()
+_SCHEMA_LOCK = threading.Lock()
+
+
+class OAuthConnection(psycopg.Connection):
+    """
+    psycopg connection that authenticates with the current OAuth token
+
+    The token is injected as the password on every (re)connect, so pooled
+    connections opened after a token refresh never use an expired token.
+
+    Repeated statements (status/result updates, lookups) are automatically
+    prepared server-side, skipping the parse/plan step on later executions.
+    """
+
+    @classmethod
+    def connect(cls, conninfo: str = "", **kwargs):
+        kwargs["password"] = get_databricks_token()
+        conn = super().connect(conninfo, **kwargs)
+        conn.prepare_threshold = LAKEBASE_PREPARE_THRESHOLD
+        conn.prepared_max = LAKEBASE_PREPARED_MAX
+        return conn
+
 
 class LakebaseConnectionManager:
     """
-    Manages psycopg2 connections to Lakebase with OAuth token authentication
+    Manages psycopg connections to Lakebase with OAuth token authentication
     """
 
     def __init__(self):
@@ -39,43 +83,236 @@ class LakebaseConnectionManager:
                 "Ensure the Lakebase database resource is added to your Databricks App."
             )
 
-        # Initialize Databricks SDK for token generation
-        self.w = WorkspaceClient()
+        self._conn_kwargs = {
+            "host": self.host,
+            "port": self.port,
+            "dbname": self.database,
+            "user": self.user,
+            "sslmode": self.sslmode,
+        }
+
+        # Connection pool is created on first use (avoid blocking on import)
+        self._pool = None
+        self._pool_lock = threading.Lock()
+
+        # Connection pinned by pipelined() for the current thread, if any
+        self._local = threading.local()
 
         logger.info(f"LakebaseConnectionManager initialized: {self.host}:{self.port}/{self.database}")
 
     def _get_token(self):
         """
-        Get OAuth token from WorkspaceClient config
+        Get OAuth token from the shared, expiry-aware token cache
         """
-        return self.w.config.oauth_token().access_token
+        return get_databricks_token()
 
     def get_connection(self):
         """
-        Get a new connection to the Lakebase database using OAuth token.
+        Get a new, unpooled connection to the Lakebase database using OAuth token.
+
+        Table operations should use connection() / execute() instead, which
+        reuse pooled connections rather than paying TCP + TLS + auth per call.
 
         Returns:
-            psycopg2 connection
-        """
-        token = self._get_token()
-
-        conn = psycopg2.connect(
-            host=self.host,
-            port=self.port,
-            dbname=self.database,
-            user=self.user,
-            password=token,
-            sslmode=self.sslmode,
-        )
-        return conn
+            psycopg connection
+        """
+        return OAuthConnection.connect(**self._conn_kwargs)
+
+    @property
+    def pool(self) -> ConnectionPool:
+        """
+        Get (and lazily open) the shared connection pool
+
+        Connections are checked before being handed out, so one the server
+        closed while idle (or lost in a network blip) is replaced instead of
+        failing the caller's first statement.
+        """
+        if self._pool is None:
+            with self._pool_lock:
+                if self._pool is None:
+                    self._pool = ConnectionPool(
+                        kwargs=self._conn_kwargs,
+                        connection_class=OAuthConnection,
+                        min_size=LAKEBASE_POOL_MIN_SIZE,
+                        max_size=LAKEBASE_POOL_MAX_SIZE,
+                        max_idle=LAKEBASE_POOL_MAX_IDLE,
+                        max_lifetime=LAKEBASE_POOL_MAX_LIFETIME,
+                        check=ConnectionPool.check_connection,
+                        open=True,
+                    )
+                    logger.info(
+                        f"Lakebase connection pool opened (min={LAKEBASE_POOL_MIN_SIZE}, max={LAKEBASE_POOL_MAX_SIZE})"
+                    )
+        return self._pool
+
+    @contextmanager
+    def connection(self):
+        """
+        Borrow a pooled connection for the duration of a with-block.
+
+        The transaction is committed when the block exits normally and rolled
+        back on error; the connection is then returned to the pool. Inside a
+        pipelined() block the thread's pinned connection is yielded instead,
+        wrapped in its own transaction that commits (or rolls back) when this
+        block exits.
+
+        Yields:
+            psycopg connection
+        """
+        pinned = getattr(self._local, "conn", None)
+        if pinned is not None:
+            # The transaction exit syncs the pipeline, so errors surface here,
+            # on the statement that caused them
+            with pinned.transaction():
+                yield pinned
+            return
+
+        with self.pool.connection() as conn:
+            yield conn
+
+    @contextmanager
+    def pipelined(self):
+        """
+        Run every table call this thread makes inside the with-block on one pinned connection.
+
+        One pooled connection is pinned in libpq pipeline mode for the block,
+        so the table calls made in it (from any table sharing this manager)
+        skip the pool checkout and send BEGIN, the statement and COMMIT
+        together. Each call still commits separately: a failed write is raised
+        by that call and rolls back only itself. Nested pipelined() blocks join
+        the outer one.
+        """
+        if getattr(self._local, "conn", None) is not None:
+            yield
+            return
+
+        with self.pool.connection() as conn:
+            with conn.pipeline():
+                self._local.conn = conn
+                try:
+                    yield
+                finally:
+                    self._local.conn = None
+
+    def execute(self, sql: str, params: Optional[Sequence[Any]] = None, durable: bool = True) -> int:
+        """
+        Execute a single statement on a pooled connection and commit.
+
+        Args:
+            sql: SQL statement
+            params: Statement parameters
+            durable: Wait for the WAL flush on commit; False for progress writes
+                that can be lost on a crash (see set_commit_durability)
+
+        Returns:
+            Number of rows affected
+        """
+        with self.connection() as conn:
+            with conn.cursor() as cur:
+                self.set_commit_durability(cur, durable)
+                cur.execute(sql, params)
+                return cur.rowcount
+
+    def set_commit_durability(self, cur, durable: bool) -> None:
+        """
+        Set synchronous_commit for the transaction the cursor's statement joins.
+
+        Non-durable writes use SET LOCAL synchronous_commit = off, so COMMIT
+        returns without waiting for the WAL flush. No-op when
+        LAKEBASE_ASYNC_COMMIT is disabled.
+
+        Args:
+            cur: Cursor about to execute the write
+            durable: Whether this write needs a durable commit
+        """
+        if LAKEBASE_ASYNC_COMMIT and not durable:
+            cur.execute("SET LOCAL synchronous_commit = off")
+
+    def execute_pipeline(self, statements: List[Tuple[str, Sequence[Any]]]) -> None:
+        """
+        Execute several statements in one transaction using libpq pipeline mode.
+
+        All statements are sent without waiting for each result, so a batch of
+        N writes costs roughly one network round trip instead of N.
+
+        Args:
+            statements: List of (sql, params) tuples
+        """
+        if not statements:
+            return
+
+        # connection() commits on successful exit and rolls back on error
+        with self.connection() as conn:
+            with conn.pipeline():
+                for sql, params in statements:
+                    conn.execute(sql, params)
 
     def dispose(self):
         """
-        Cleanup (no-op for psycopg2 without connection pool)
+        Close the connection pool (if opened)
         """
+        if self._pool is not None:
+            self._pool.close()
+            self._pool = None
         logger.info("LakebaseConnectionManager disposed")
 
 
+def ensure_table_ready(table_name: str, *ensure_steps: Callable[[], None]) -> None:
+    """
+    Run a table's CREATE SCHEMA / CREATE TABLE steps once per process
+
+    Later table instances skip the DDL round trips entirely. Skipped for every
+    table when SKIP_SCHEMA_CHECK is set (DDL applied out of band).
+
+    Args:
+        table_name: Fully qualified table name
+        *ensure_steps: Callables that create the schema, table, indexes, etc.
+    """
+    if SKIP_SCHEMA_CHECK or table_name in _SCHEMA_READY:
+        return
+
+    with _SCHEMA_LOCK:
+        if table_name in _SCHEMA_READY:
+            return
+        for step in ensure_steps:
+            step()
+        _SCHEMA_READY.add(table_name)
+
+
+def ensure_simple_table(
+    conn_manager: "LakebaseConnectionManager",
+    table_name: str,
+    columns_sql: str,
+    description: str
+) -> None:
+    """
+    Create a table (and its schema) with CREATE ... IF NOT EXISTS, once per process
+
+    For the tables that need no indexes or migrations (uploads and cache tables).
+
+    Args:
+        conn_manager: Connection manager to run the DDL on
+        table_name: Fully qualified table name
+        columns_sql: Column definitions for CREATE TABLE
+        description: Table description for log messages (e.g. "uploads table")
+    """
+    def create_schema():
+        # Extract schema name from table_name (e.g., "unstructured_parsequery.uploads" -> "unstructured_parsequery")
+        schema_name = table_name.split('.')[0] if '.' in table_name else "unstructured_parsequery"
+        conn_manager.execute(f"CREATE SCHEMA IF NOT EXISTS {schema_name}")
+
+    def create_table():
+        logger.info(f"Ensuring {description} exists: {table_name}")
+        conn_manager.execute(f"CREATE TABLE IF NOT EXISTS {table_name} ({columns_sql})")
+        logger.info(f"{description.capitalize()} created/ensured successfully: {table_name}")
+
+    try:
+        ensure_table_ready(table_name, create_schema, create_table)
+    except Exception as e:
+        logger.error(f"Failed to create {description}: {str(e)}", exc_info=True)
+        raise
+
+
 def get_connection_manager():
     """
     Get or create singleton connection manager
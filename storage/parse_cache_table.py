@@ -0,0 +1,120 @@
+"""
+Lakebase PostgreSQL Storage for Parse Results Cache
+
+Caches ai_parse_document output keyed by the SHA-256 content hash of the
+source file, so parsing identical bytes again skips the SQL warehouse call.
+"""
+
+import orjson
+import logging
+from datetime import datetime
+from typing import Dict, Any, Optional
+from config import PARSE_CACHE_TABLE_NAME
+from storage.lakebase_connection import get_connection_manager, ensure_simple_table
+
+logger = logging.getLogger(__name__)
+
+# CREATE TABLE column definitions
+_PARSE_CACHE_COLUMNS = """
+    file_hash_sha256 TEXT PRIMARY KEY,
+    document_text TEXT,
+    parsed_doc TEXT,
+    image_output_path TEXT,
+    created_at TIMESTAMPTZ DEFAULT CURRENT_TIMESTAMP
+"""
+
+
+class ParseCacheTable:
+    """
+    Manages the content-hash keyed parse cache in Lakebase PostgreSQL
+    """
+
+    def __init__(self, table_name: str = None):
+        """
+        Initialize parse cache table manager
+
+        Args:
+            table_name: Table name (default from config)
+        """
+        self.table_name = table_name or PARSE_CACHE_TABLE_NAME
+        self.conn_manager = get_connection_manager()
+        ensure_simple_table(self.conn_manager, self.table_name, _PARSE_CACHE_COLUMNS, "parse cache table")
+        logger.info(f"ParseCacheTable initialized: {self.table_name}")
+
+    def get_parse(self, file_hash: str) -> Optional[Dict[str, Any]]:
+        """
+        Get cached parse output for a file hash
+
+        Args:
+            file_hash: SHA-256 hex digest of the source file
+
+        Returns:
+            Dictionary with document_text, parsed_doc and image_output_path, or None on miss
+        """
+        try:
+            select_sql = f"""
+                SELECT document_text, parsed_doc, image_output_path
+                FROM {self.table_name}
+                WHERE file_hash_sha256 = %s
+            """
+
+            with self.conn_manager.connection() as conn:
+                with conn.cursor() as cur:
+                    cur.execute(select_sql, (file_hash,))
+                    row = cur.fetchone()
+
+            if not row:
+                return None
+
+            document_text, parsed_doc, image_output_path = row
+            return {
+                "document_text": document_text,
+                "parsed_doc": orjson.loads(parsed_doc) if parsed_doc else None,
+                "image_output_path": image_output_path
+            }
+
+        except Exception as e:
+            logger.error(f"Error getting cached parse: {str(e)}", exc_info=True)
+            return None
+
+    def store_parse(
+        self,
+        file_hash: str,
+        document_text: str,
+        image_output_path: str,
+        parsed_doc: Optional[Dict[str, Any]] = None
+    ) -> bool:
+        """
+        Store parse output for a file hash
+
+        Args:
+            file_hash: SHA-256 hex digest of the source file
+            document_text: Extracted document text
+            image_output_path: Volume path where ai_parse_document wrote images
+            parsed_doc: Full ai_parse_document output (optional)
+
+        Returns:
+            True if successful, False otherwise
+        """
+        try:
+            # Keep an existing parsed_doc if this write doesn't carry one
+            upsert_sql = f"""
+                INSERT INTO {self.table_name} AS cache
+                (file_hash_sha256, document_text, parsed_doc, image_output_path, created_at)
+                VALUES (%s, %s, %s, %s, %s)
+                ON CONFLICT (file_hash_sha256) DO UPDATE SET
+                    document_text = EXCLUDED.document_text,
+                    parsed_doc = COALESCE(EXCLUDED.parsed_doc, cache.parsed_doc),
+                    image_output_path = EXCLUDED.image_output_path
+            """
+
+            parsed_doc_json = orjson.dumps(parsed_doc).decode("utf-8") if parsed_doc is not None else None
+
+            self.conn_manager.execute(upsert_sql, (file_hash, document_text, parsed_doc_json, image_output_path, datetime.now().astimezone()))
+
+            logger.info(f"Cached parse result for hash {file_hash[:12]}")
+            return True
+
+        except Exception as e:
+            logger.error(f"Failed to cache parse result: {str(e)}", exc_info=True)
+            return False
@@ -2,18 +2,57 @@
 Lakebase PostgreSQL Storage for Pipeline Results
 
 Stores pipeline stage results in PostgreSQL table in Lakebase.
-Each stage result is stored as a JSON string in its own column.
+Each stage result is stored as JSONB in its own column (decoded to a dict on read).
 """
 
-import json
+import re
+import orjson
 import logging
 from datetime import datetime
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Union
+from psycopg.rows import dict_row
 from config import RESULTS_TABLE_NAME
-from storage.lakebase_connection import get_connection_manager
+from storage.lakebase_connection import get_connection_manager, ensure_table_ready
 
 logger = logging.getLogger(__name__)
 
+# Stage name -> result column
+_STAGE_COLUMNS = {
+    "parse": "parse_result",
+    "categorize": "categorize_result",
+    "extract": "extract_result",
+    "deidentify": "deidentify_result"
+}
+
+# JSON escape of U+0000 (not itself an escaped backslash): jsonb rejects it, and
+# parsed PDF text can contain NUL characters
+_NUL_ESCAPE = re.compile(r'(?<!\\)((?:\\\\)*)\\u0000')
+
+# One constant upsert per stage column, built once at import so each call reuses
+# the same SQL text (and the same prepared statement on a pooled connection).
+# The first stage write creates the row; trace metadata is kept once set.
+_UPSERT_SQLS = {
+    stage: f"""
+        INSERT INTO {RESULTS_TABLE_NAME} AS results
+        (file_id, trace_id, experiment_id, source_volume_path, {column}, created_at, updated_at)
+        VALUES (%s, %s, %s, %s, %s::jsonb, %s, %s)
+        ON CONFLICT (file_id) DO UPDATE SET
+            {column} = EXCLUDED.{column},
+            trace_id = COALESCE(EXCLUDED.trace_id, results.trace_id),
+            experiment_id = COALESCE(EXCLUDED.experiment_id, results.experiment_id),
+            source_volume_path = COALESCE(EXCLUDED.source_volume_path, results.source_volume_path),
+            updated_at = EXCLUDED.updated_at
+    """
+    for stage, column in _STAGE_COLUMNS.items()
+}
+
+
+def _strip_nul_escapes(json_text: str) -> str:
+    """Drop \\u0000 escapes from a JSON document so it can be stored as JSONB"""
+    if "\\u0000" not in json_text:
+        return json_text
+    return _NUL_ESCAPE.sub(r"\1", json_text)
+
 
 class ResultsTable:
     """
@@ -24,8 +63,7 @@ class ResultsTable:
         """Initialize results table manager"""
         self.table_name = RESULTS_TABLE_NAME
         self.conn_manager = get_connection_manager()
-        self._ensure_schema_exists()
-        self._ensure_table_exists()
+        ensure_table_ready(self.table_name, self._ensure_schema_exists, self._ensure_table_exists)
         logger.info(f"ResultsTable initialized: {self.table_name}")
 
     def _ensure_schema_exists(self):
@@ -41,13 +79,7 @@ class ResultsTable:
 
             create_schema_sql = f"CREATE SCHEMA IF NOT EXISTS {schema_name}"
 
-            conn = self.conn_manager.get_connection()
-            try:
-                with conn.cursor() as cur:
-                    cur.execute(create_schema_sql)
-                conn.commit()
-            finally:
-                conn.close()
+            self.conn_manager.execute(create_schema_sql)
 
             logger.info(f"Schema created/ensured successfully: {schema_name}")
 
@@ -67,22 +99,17 @@ class ResultsTable:
                     trace_id VARCHAR(255),
                     experiment_id VARCHAR(255),
                     source_volume_path VARCHAR(1000),
-                    parse_result TEXT,
-                    categorize_result TEXT,
-                    extract_result TEXT,
-                    deidentify_result TEXT,
+                    parse_result JSONB,
+                    categorize_result JSONB,
+                    extract_result JSONB,
+                    deidentify_result JSONB,
                     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
                     updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
                 )
             """
 
-            conn = self.conn_manager.get_connection()
-            try:
-                with conn.cursor() as cur:
-                    cur.execute(create_table_sql)
-                conn.commit()
-            finally:
-                conn.close()
+            self.conn_manager.execute(create_table_sql)
+            self._migrate_result_columns_to_jsonb()
 
             logger.info(f"Results table created/ensured successfully: {self.table_name}")
 
@@ -90,13 +117,55 @@ class ResultsTable:
             logger.error(f"Failed to create results table: {str(e)}", exc_info=True)
             raise
 
+    def _migrate_result_columns_to_jsonb(self):
+        """Convert result columns of tables created before JSONB from TEXT to JSONB"""
+        if '.' in self.table_name:
+            schema_name, table = self.table_name.split('.', 1)
+        else:
+            schema_name, table = "public", self.table_name
+
+        with self.conn_manager.connection() as conn:
+            with conn.cursor() as cur:
+                cur.execute(
+                    """
+                    SELECT column_name FROM information_schema.columns
+                    WHERE table_schema = %s AND table_name = %s
+                      AND column_name = ANY(%s) AND data_type = 'text'
+                    """,
+                    (schema_name, table, list(_STAGE_COLUMNS.values()))
+                )
+                text_columns = [row[0] for row in cur.fetchall()]
+
+                if not text_columns:
+                    return
+
+                logger.info(f"Migrating result columns to JSONB: {text_columns}")
+                alter_clauses = ", ".join(
+                    f"ALTER COLUMN {column} TYPE JSONB USING pg_temp.try_jsonb({column})"
+                    for column in text_columns
+                )
+                # Legacy TEXT values may hold NUL escapes (dropped here) or NaN/Infinity
+                # (not valid JSON): convert what parses and NULL the rest instead of
+                # letting one bad row abort the whole ALTER
+                cur.execute(r"""
+                    CREATE OR REPLACE FUNCTION pg_temp.try_jsonb(value TEXT) RETURNS JSONB
+                    LANGUAGE plpgsql AS $$
+                    BEGIN
+                        RETURN replace(NULLIF(value, ''), '\u0000', '')::jsonb;
+                    EXCEPTION WHEN others THEN
+                        RETURN NULL;
+                    END
+                    $$
+                """)
+                cur.execute(f"ALTER TABLE {self.table_name} {alter_clauses}")
+
     def create_result_record(
         self,
         file_id: str,
         trace_id: Optional[str] = None,
         experiment_id: Optional[str] = None,
         source_volume_path: Optional[str] = None
-    ) -> bool:
+    ) -> Optional[Dict[str, Any]]:
         """
         Create initial result record for a pipeline run
 
@@ -107,7 +176,7 @@ class ResultsTable:
             source_volume_path: Path to source file in UC volume
 
         Returns:
-            True if successful, False otherwise
+            Dictionary with file_id, created_at and updated_at, or None on failure
         """
         try:
             now = datetime.now()
@@ -116,73 +185,70 @@ class ResultsTable:
                 INSERT INTO {self.table_name}
                 (file_id, trace_id, experiment_id, source_volume_path, created_at, updated_at)
                 VALUES (%s, %s, %s, %s, %s, %s)
+                RETURNING file_id, created_at, updated_at
             """
 
-            conn = self.conn_manager.get_connection()
-            try:
-                with conn.cursor() as cur:
+            with self.conn_manager.connection() as conn:
+                with conn.cursor(row_factory=dict_row) as cur:
                     cur.execute(insert_sql, (file_id, trace_id, experiment_id, source_volume_path, now, now))
-                conn.commit()
-            finally:
-                conn.close()
+                    row = cur.fetchone()
 
             logger.info(f"Created result record for file_id: {file_id}")
-            return True
+            return row
 
         except Exception as e:
             logger.error(f"Failed to create result record: {str(e)}", exc_info=True)
-            return False
+            return None
 
     def update_stage_result(
         self,
         file_id: str,
         stage_name: str,
-        result_data: Dict[str, Any]
+        result_data: Union[Dict[str, Any], str, bytes],
+        trace_id: Optional[str] = None,
+        experiment_id: Optional[str] = None,
+        source_volume_path: Optional[str] = None
     ) -> bool:
         """
-        Update result for a specific stage
+        Store result for a specific stage, creating the result record if needed
+
+        A single upsert per stage replaces the separate create_result_record
+        INSERT, so no initial row is required before the first stage write.
 
         Args:
             file_id: Pipeline/file ID
             stage_name: Stage name (parse, categorize, extract, deidentify)
-            result_data: Result data to store as JSON string
+            result_data: Result data to store as JSONB, or an already-serialized
+                JSON str/bytes payload (stored as-is, skipping re-serialization)
+            trace_id: MLflow trace ID (kept if already set and None here)
+            experiment_id: MLflow experiment ID (kept if already set and None here)
+            source_volume_path: Path to source file in UC volume (kept if already set and None here)
 
         Returns:
             True if successful, False otherwise
         """
         try:
-            # Map stage name to column
-            column_map = {
-                "parse": "parse_result",
-                "categorize": "categorize_result",
-                "extract": "extract_result",
-                "deidentify": "deidentify_result"
-            }
-
-            if stage_name not in column_map:
+            upsert_sql = _UPSERT_SQLS.get(stage_name)
+            if upsert_sql is None:
                 logger.warning(f"Unknown stage name: {stage_name}, skipping result storage")
                 return False
 
-            column_name = column_map[stage_name]
-
-            # Convert result to JSON string
-            result_json = json.dumps(result_data)
-
-            # Update the specific column
-            update_sql = f"""
-                UPDATE {self.table_name}
-                SET {column_name} = %s,
-                    updated_at = %s
-                WHERE file_id = %s
-            """
+            # Convert result to JSON string (orjson also serializes datetimes/non-str keys natively).
+            # Not memoized by object identity: stage results are mutated after being stored
+            # (deidentify masks extracted entities in place), so a cached encoding could be stale.
+            if isinstance(result_data, bytes):
+                result_json = result_data.decode("utf-8")
+            elif isinstance(result_data, str):
+                result_json = result_data
+            else:
+                result_json = orjson.dumps(result_data, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+            result_json = _strip_nul_escapes(result_json)
 
-            conn = self.conn_manager.get_connection()
-            try:
-                with conn.cursor() as cur:
-                    cur.execute(update_sql, (result_json, datetime.now(), file_id))
-                conn.commit()
-            finally:
-                conn.close()
+            now = datetime.now()
+            # Not durable: a result lost in a crash is recomputed when the file is reprocessed
+            self.conn_manager.execute(upsert_sql, (
+                file_id, trace_id, experiment_id, source_volume_path, result_json, now, now
+            ), durable=False)
 
             logger.info(f"Updated {stage_name} result for file_id: {file_id}")
             return True
@@ -199,7 +265,7 @@ class ResultsTable:
             file_id: Pipeline/file ID
 
         Returns:
-            Result record or None
+            Result record or None (the *_result columns are already decoded dicts)
         """
         try:
             query = f"""
@@ -218,20 +284,12 @@ class ResultsTable:
                 WHERE file_id = %s
             """
 
-            conn = self.conn_manager.get_connection()
-            try:
-                with conn.cursor() as cur:
+            with self.conn_manager.connection() as conn:
+                with conn.cursor(row_factory=dict_row) as cur:
                     cur.execute(query, (file_id,))
                     row = cur.fetchone()
 
-                    if row:
-                        # Get column names from cursor description
-                        cols = [desc[0] for desc in cur.description]
-                        return dict(zip(cols, row))
-            finally:
-                conn.close()
-
-            return None
+            return row
 
         except Exception as e:
             logger.error(f"Error getting results: {str(e)}", exc_info=True)
@@ -2,17 +2,59 @@
 Lakebase PostgreSQL Storage for Processing Status
 
 Manages PostgreSQL table in Lakebase for tracking file processing status.
-Uses psycopg2 with parameterized queries for security and performance.
+Uses psycopg with parameterized queries for security and performance.
 """
 
+import hashlib
 import logging
+import threading
+import time
+from collections import OrderedDict
 from datetime import datetime
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, Iterator, List, Optional, Tuple
+from psycopg.rows import dict_row
 from config import STATUS_TABLE_NAME
-from storage.lakebase_connection import get_connection_manager
+from storage.lakebase_connection import get_connection_manager, ensure_table_ready
 
 logger = logging.getLogger(__name__)
 
+# Stages with a stage_<name>_status column
+_PIPELINE_STAGES = ("ingest", "parse", "categorize", "extract", "deidentify")
+
+# Columns update_file_status may set. Every call uses one constant UPDATE that
+# covers all of them, so the SQL text (and its prepared statement) never changes
+# with the subset of fields being updated.
+_UPDATABLE_COLUMNS = (
+    "status",
+    "current_stage",
+    "volume_path",
+    "trace_id",
+    "experiment_id",
+    "run_id",
+    "log_file_path",
+    "start_time",
+    "end_time",
+    "error_message",
+    "stage_ingest_status",
+    "stage_parse_status",
+    "stage_categorize_status",
+    "stage_extract_status",
+    "stage_deidentify_status",
+    "primary_category",
+    "entities_count",
+    "pii_items_masked",
+)
+
+# Listings larger than this are streamed through a server-side cursor in
+# batches instead of being fetched in one client-side result set
+_SERVER_CURSOR_MIN_LIMIT = 1000
+_SERVER_CURSOR_BATCH_SIZE = 1000
+
+# Last committed update per file_id, so an identical repeated update_file_status
+# (retries, idempotent re-sends) is skipped without a round trip
+_STATUS_MEMO_MAX_SIZE = 10_000
+_STATUS_MEMO_TTL_SECONDS = 60
+
 
 class ProcessingStatusTable:
     """
@@ -28,8 +70,17 @@ class ProcessingStatusTable:
         """
         self.table_name = table_name or STATUS_TABLE_NAME
         self.conn_manager = get_connection_manager()
-        self._ensure_schema_exists()
-        self._ensure_table_exists()
+        # Each column is only overwritten when its flag parameter is true, which
+        # (unlike COALESCE) still allows explicitly resetting a column to NULL
+        self._update_status_sql = (
+            f"UPDATE {self.table_name} SET updated_at = %s, "
+            + ", ".join(f"{col} = CASE WHEN %s THEN %s ELSE {col} END" for col in _UPDATABLE_COLUMNS)
+            + " WHERE file_id = %s"
+        )
+        # file_id -> (update digest, time.monotonic() when written)
+        self._last_updates = OrderedDict()
+        self._last_updates_lock = threading.Lock()
+        ensure_table_ready(self.table_name, self._ensure_schema_exists, self._ensure_table_exists)
 
     def _ensure_schema_exists(self):
         """Create schema if it doesn't exist (app has CREATE on database)"""
@@ -44,13 +95,7 @@ class ProcessingStatusTable:
 
             create_schema_sql = f"CREATE SCHEMA IF NOT EXISTS {schema_name}"
 
-            conn = self.conn_manager.get_connection()
-            try:
-                with conn.cursor() as cur:
-                    cur.execute(create_schema_sql)
-                conn.commit()
-            finally:
-                conn.close()
+            self.conn_manager.execute(create_schema_sql)
 
             logger.info(f"Schema created/ensured successfully: {schema_name}")
 
@@ -91,13 +136,20 @@ class ProcessingStatusTable:
                 )
             """
 
-            conn = self.conn_manager.get_connection()
-            try:
-                with conn.cursor() as cur:
-                    cur.execute(create_table_sql)
-                conn.commit()
-            finally:
-                conn.close()
+            self.conn_manager.execute(create_table_sql)
+
+            # Indexes for the dashboard listing (newest first), recently-updated reads,
+            # and a partial index covering only the in-flight rows
+            index_prefix = self.table_name.split('.')[-1]
+            create_index_sqls = [
+                f"CREATE INDEX IF NOT EXISTS {index_prefix}_created_at_file_id_idx "
+                f"ON {self.table_name} (created_at DESC, file_id DESC)",
+                f"CREATE INDEX IF NOT EXISTS {index_prefix}_updated_at_idx ON {self.table_name} (updated_at DESC)",
+                f"CREATE INDEX IF NOT EXISTS {index_prefix}_active_status_idx ON {self.table_name} (status, created_at DESC) "
+                f"WHERE status IN ('pending', 'processing')",
+            ]
+            for create_index_sql in create_index_sqls:
+                self.conn_manager.execute(create_index_sql)
 
             logger.info(f"Table created/ensured successfully: {self.table_name}")
 
@@ -110,7 +162,7 @@ class ProcessingStatusTable:
         file_id: str,
         filename: str,
         volume_path: str = None
-    ) -> None:
+    ) -> Optional[Dict[str, Any]]:
         """
         Insert new file record with initial status
 
@@ -118,6 +170,9 @@ class ProcessingStatusTable:
             file_id: Unique file identifier
             filename: Original filename
             volume_path: Path in UC volume
+
+        Returns:
+            Dictionary with file_id, created_at and updated_at of the new row
         """
         try:
             now = datetime.now()
@@ -133,22 +188,76 @@ class ProcessingStatusTable:
                     created_at,
                     updated_at
                 ) VALUES (%s, %s, %s, 'pending', 'ingest', %s, %s, %s)
+                RETURNING file_id, created_at, updated_at
             """
 
-            conn = self.conn_manager.get_connection()
-            try:
-                with conn.cursor() as cur:
+            with self.conn_manager.connection() as conn:
+                with conn.cursor(row_factory=dict_row) as cur:
                     cur.execute(insert_sql, (file_id, filename, volume_path, now, now, now))
-                conn.commit()
-            finally:
-                conn.close()
+                    row = cur.fetchone()
 
             logger.info(f"Inserted file record: {file_id}")
+            return row
 
         except Exception as e:
             logger.error(f"Error inserting file record: {str(e)}", exc_info=True)
             raise
 
+    def insert_file_records_bulk(
+        self,
+        records: List[Tuple[str, str, Optional[str]]],
+        status: str = "pending",
+        current_stage: str = "ingest"
+    ) -> int:
+        """
+        Insert many new file records in one batch
+
+        Rows are sent with executemany, which psycopg pipelines, so enrolling N
+        files costs about one round trip and one commit instead of N of each.
+
+        Args:
+            records: List of (file_id, filename, volume_path) tuples
+            status: Initial overall status for every record
+            current_stage: Initial pipeline stage for every record
+
+        Returns:
+            Number of records inserted
+        """
+        if not records:
+            return 0
+
+        try:
+            now = datetime.now()
+
+            insert_sql = f"""
+                INSERT INTO {self.table_name} (
+                    file_id,
+                    filename,
+                    volume_path,
+                    status,
+                    current_stage,
+                    start_time,
+                    created_at,
+                    updated_at
+                ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
+            """
+
+            rows = [
+                (file_id, filename, volume_path, status, current_stage, now, now, now)
+                for file_id, filename, volume_path in records
+            ]
+
+            with self.conn_manager.connection() as conn:
+                with conn.cursor() as cur:
+                    cur.executemany(insert_sql, rows)
+
+            logger.info(f"Inserted {len(rows)} file records")
+            return len(rows)
+
+        except Exception as e:
+            logger.error(f"Error bulk inserting file records: {str(e)}", exc_info=True)
+            raise
+
     def update_file_status(
         self,
         file_id: str,
@@ -159,6 +268,8 @@ class ProcessingStatusTable:
         experiment_id: str = None,
         run_id: str = None,
         error_message: str = None,
+        updated_at: datetime = None,
+        durable: bool = False,
         **stage_statuses
     ) -> None:
         """
@@ -173,70 +284,93 @@ class ProcessingStatusTable:
             experiment_id: MLflow experiment ID
             run_id: MLflow run ID
             error_message: Error message if failed
+            updated_at: Timestamp for updated_at (callers that already took one for
+                end_time etc. pass it so the row shares a single clock reading)
+            durable: Wait for the WAL flush on commit. Progress updates are not
+                durable by default (a crash only loses the latest progress)
             **stage_statuses: Individual stage statuses and other fields
         """
         try:
-            # Build dynamic UPDATE query
-            set_clauses = ["updated_at = %s"]
-            params = [datetime.now()]
+            # Explicit fields are only applied when set; additional fields from
+            # stage_statuses are applied as given (None resets the column)
+            updates = {
+                key: value
+                for key, value in (
+                    ("status", status),
+                    ("current_stage", current_stage),
+                    ("volume_path", volume_path),
+                    ("trace_id", trace_id),
+                    ("experiment_id", experiment_id),
+                    ("run_id", run_id),
+                    ("error_message", error_message),
+                )
+                if value
+            }
+            updates.update(stage_statuses)
+
+            if not updates:
+                logger.warning(f"No updates provided for file_id: {file_id}")
+                return
+
+            unknown = set(updates) - set(_UPDATABLE_COLUMNS)
+            if unknown:
+                raise ValueError(f"Unknown status columns: {sorted(unknown)}")
+
+            digest = self._update_digest(updates)
+            if self._is_repeat_update(file_id, digest):
+                logger.debug(f"Skipping unchanged status update for file_id: {file_id}")
+                return
 
-            if status:
-                set_clauses.append("status = %s")
-                params.append(status)
-            if current_stage:
-                set_clauses.append("current_stage = %s")
-                params.append(current_stage)
-            if volume_path:
-                set_clauses.append("volume_path = %s")
-                params.append(volume_path)
             if trace_id:
                 logger.info(f"Adding trace_id to update: {trace_id}")
-                set_clauses.append("trace_id = %s")
-                params.append(trace_id)
             if experiment_id:
                 logger.info(f"Adding experiment_id to update: {experiment_id}")
-                set_clauses.append("experiment_id = %s")
-                params.append(experiment_id)
-            if run_id:
-                set_clauses.append("run_id = %s")
-                params.append(run_id)
-            if error_message:
-                set_clauses.append("error_message = %s")
-                params.append(error_message)
-
-            # Handle additional fields from stage_statuses
-            for key, value in stage_statuses.items():
-                set_clauses.append(f"{key} = %s")
-                params.append(value)
-
-            if len(set_clauses) == 1:  # Only updated_at
-                logger.warning(f"No updates provided for file_id: {file_id}")
-                return
 
-            # Add file_id to params for WHERE clause
+            # (apply flag, value) per column, then file_id for the WHERE clause
+            params = [updated_at or datetime.now()]
+            for col in _UPDATABLE_COLUMNS:
+                params.append(col in updates)
+                params.append(updates.get(col))
             params.append(file_id)
 
-            set_clause = ", ".join(set_clauses)
-            update_sql = f"""
-                UPDATE {self.table_name}
-                SET {set_clause}
-                WHERE file_id = %s
-            """
+            self.conn_manager.execute(self._update_status_sql, params, durable=durable)
 
-            conn = self.conn_manager.get_connection()
-            try:
-                with conn.cursor() as cur:
-                    cur.execute(update_sql, params)
-                conn.commit()
-            finally:
-                conn.close()
+            self._remember_update(file_id, digest)
 
             logger.info(f"Updated file status: {file_id}")
 
         except Exception as e:
+            self._remember_update(file_id, None)
             logger.error(f"Error updating file status: {str(e)}", exc_info=True)
             raise
 
+    @staticmethod
+    def _update_digest(updates: Dict[str, Any]) -> bytes:
+        """Content hash of an update's column values"""
+        return hashlib.blake2b(repr(sorted(updates.items())).encode("utf-8"), digest_size=16).digest()
+
+    def _is_repeat_update(self, file_id: str, digest: bytes) -> bool:
+        """Whether the same update was committed for this file within the memo TTL"""
+        with self._last_updates_lock:
+            entry = self._last_updates.get(file_id)
+            if entry is None:
+                return False
+            last_digest, written_at = entry
+            if time.monotonic() - written_at > _STATUS_MEMO_TTL_SECONDS:
+                del self._last_updates[file_id]
+                return False
+            return last_digest == digest
+
+    def _remember_update(self, file_id: str, digest: Optional[bytes]) -> None:
+        """Record the last committed update for a file (None forgets it)"""
+        with self._last_updates_lock:
+            self._last_updates.pop(file_id, None)
+            if digest is None:
+                return
+            self._last_updates[file_id] = (digest, time.monotonic())
+            while len(self._last_updates) > _STATUS_MEMO_MAX_SIZE:
+                self._last_updates.popitem(last=False)
+
     def get_file_status(self, file_id: str) -> Optional[Dict[str, Any]]:
         """
         Get status for a specific file
@@ -253,64 +387,129 @@ class ProcessingStatusTable:
                 WHERE file_id = %s
             """
 
-            conn = self.conn_manager.get_connection()
-            try:
-                with conn.cursor() as cur:
+            with self.conn_manager.connection() as conn:
+                with conn.cursor(row_factory=dict_row) as cur:
                     cur.execute(select_sql, (file_id,))
                     row = cur.fetchone()
 
-                    if row:
-                        # Get column names from cursor description
-                        cols = [desc[0] for desc in cur.description]
-                        return dict(zip(cols, row))
-            finally:
-                conn.close()
-
-            return None
+            return row
 
         except Exception as e:
             logger.error(f"Error getting file status: {str(e)}", exc_info=True)
             return None
 
-    def get_all_files(self, limit: int = 100) -> List[Dict[str, Any]]:
+    def get_all_files(
+        self,
+        limit: int = 100,
+        status: str = None,
+        created_before: datetime = None,
+        before_file_id: str = None
+    ) -> List[Dict[str, Any]]:
         """
-        Get status for all files
+        Get status for all files, newest first
 
         Args:
             limit: Maximum number of records to return
+            status: Only return files with this overall status (e.g. 'processing')
+            created_before: Keyset cursor - only return files listed after this
+                timestamp (pass the last created_at of the previous page)
+            before_file_id: Keyset tie-breaker - the last file_id of the previous
+                page, for rows sharing its created_at (bulk inserts share one)
 
         Returns:
             List of file status dictionaries
         """
         try:
-            select_sql = f"""
-                SELECT * FROM {self.table_name}
-                ORDER BY created_at DESC
-                LIMIT %s
-            """
-
-            logger.info(f"Executing get_all_files query with limit: {limit}")
-
-            conn = self.conn_manager.get_connection()
-            try:
-                with conn.cursor() as cur:
-                    cur.execute(select_sql, (limit,))
-                    rows = cur.fetchall()
-
-                    # Get column names from cursor description
-                    cols = [desc[0] for desc in cur.description]
-
-                    # Convert rows to list of dicts
-                    results = [dict(zip(cols, row)) for row in rows]
+            logger.info(
+                f"Executing get_all_files query with limit: {limit}, status: {status}, "
+                f"created_before: {created_before}, before_file_id: {before_file_id}"
+            )
+
+            # Large admin listings: stream rows instead of holding two full copies
+            if limit > _SERVER_CURSOR_MIN_LIMIT:
+                results = list(self.iter_files(
+                    limit=limit, status=status, created_before=created_before, before_file_id=before_file_id
+                ))
+                logger.info(f"Returning {len(results)} file records")
+                return results
+
+            select_sql, params = self._select_files_sql(limit, status, created_before, before_file_id)
+
+            with self.conn_manager.connection() as conn:
+                with conn.cursor(row_factory=dict_row) as cur:
+                    cur.execute(select_sql, params)
+                    results = cur.fetchall()
                     logger.info(f"Returning {len(results)} file records")
                     return results
-            finally:
-                conn.close()
 
         except Exception as e:
             logger.error(f"Error getting all files: {str(e)}", exc_info=True)
             return []
 
+    def iter_files(
+        self,
+        limit: int,
+        status: str = None,
+        created_before: datetime = None,
+        before_file_id: str = None,
+        batch_size: int = _SERVER_CURSOR_BATCH_SIZE
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Stream file status records, newest first, through a server-side cursor
+
+        Only batch_size rows are held client-side at a time. The pooled
+        connection is held until the iterator is exhausted or closed.
+
+        Args:
+            limit: Maximum number of records to return
+            status: Only return files with this overall status
+            created_before: Only return files listed after this timestamp
+            before_file_id: Tie-breaker for rows sharing created_before (see get_all_files)
+            batch_size: Rows fetched from the server per round trip
+
+        Yields:
+            File status dictionaries
+        """
+        select_sql, params = self._select_files_sql(limit, status, created_before, before_file_id)
+
+        with self.conn_manager.connection() as conn:
+            with conn.cursor(name="iter_files_cur", row_factory=dict_row) as cur:
+                cur.itersize = batch_size
+                cur.execute(select_sql, params)
+                yield from cur
+
+    def _select_files_sql(
+        self,
+        limit: int,
+        status: str = None,
+        created_before: datetime = None,
+        before_file_id: str = None
+    ) -> Tuple[str, tuple]:
+        """Build the newest-first file listing query and its parameters"""
+        conditions = []
+        params = []
+        if status:
+            conditions.append("status = %s")
+            params.append(status)
+        if created_before and before_file_id:
+            # Keyset pagination: served by the (created_at, file_id) index, stable under
+            # inserts, and no rows skipped when a page ends inside a same-timestamp batch
+            conditions.append("(created_at, file_id) < (%s, %s)")
+            params.extend((created_before, before_file_id))
+        elif created_before:
+            conditions.append("created_at < %s")
+            params.append(created_before)
+
+        where_clause = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+        select_sql = f"""
+            SELECT * FROM {self.table_name}
+            {where_clause}
+            ORDER BY created_at DESC, file_id DESC
+            LIMIT %s
+        """
+        params.append(limit)
+        return select_sql, tuple(params)
+
     def mark_completed(
         self,
         file_id: str,
@@ -348,7 +547,8 @@ class ProcessingStatusTable:
             if pii_items_masked is not None:
                 updates["pii_items_masked"] = pii_items_masked
 
-            self.update_file_status(file_id, **updates)
+            # Terminal state: keep the commit durable
+            self.update_file_status(file_id, updated_at=now, durable=True, **updates)
 
         except Exception as e:
             logger.error(f"Error marking file as completed: {str(e)}", exc_info=True)
@@ -376,12 +576,55 @@ class ProcessingStatusTable:
                 updates["current_stage"] = current_stage
                 updates[f"stage_{current_stage}_status"] = "failed"
 
-            self.update_file_status(file_id, **updates)
+            # Terminal state: keep the commit durable
+            self.update_file_status(file_id, updated_at=now, durable=True, **updates)
 
         except Exception as e:
             logger.error(f"Error marking file as failed: {str(e)}", exc_info=True)
             raise
 
+    def mark_failed_many(self, failures: List[Tuple[str, str, Optional[str]]]) -> int:
+        """
+        Mark several files as failed in one pipelined round trip
+
+        Args:
+            failures: List of (file_id, error_message, current_stage) tuples
+
+        Returns:
+            Number of files marked as failed
+        """
+        try:
+            now = datetime.now()
+            statements = []
+
+            for file_id, error_message, current_stage in failures:
+                set_clauses = ["updated_at = %s", "status = 'failed'", "error_message = %s", "end_time = %s"]
+                params = [now, error_message, now]
+
+                if current_stage:
+                    set_clauses.append("current_stage = %s")
+                    params.append(current_stage)
+                    # Unknown stages have no status column and would abort the whole batch
+                    if current_stage in _PIPELINE_STAGES:
+                        set_clauses.append(f"stage_{current_stage}_status = 'failed'")
+
+                params.append(file_id)
+                statements.append((
+                    f"UPDATE {self.table_name} SET {', '.join(set_clauses)} WHERE file_id = %s",
+                    params
+                ))
+
+            self.conn_manager.execute_pipeline(statements)
+            for file_id, _, _ in failures:
+                self._remember_update(file_id, None)
+
+            logger.info(f"Marked {len(statements)} files as failed")
+            return len(statements)
+
+        except Exception as e:
+            logger.error(f"Error marking files as failed: {str(e)}", exc_info=True)
+            raise
+
     def delete_file_record(self, file_id: str) -> bool:
         """
         Delete a file record from the status table
@@ -398,14 +641,8 @@ class ProcessingStatusTable:
                 WHERE file_id = %s
             """
 
-            conn = self.conn_manager.get_connection()
-            try:
-                with conn.cursor() as cur:
-                    cur.execute(delete_sql, (file_id,))
-                    deleted = cur.rowcount > 0
-                conn.commit()
-            finally:
-                conn.close()
+            deleted = self.conn_manager.execute(delete_sql, (file_id,)) > 0
+            self._remember_update(file_id, None)
 
             if deleted:
                 logger.info(f"Deleted file record: {file_id}")
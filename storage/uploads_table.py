@@ -0,0 +1,120 @@
+"""
+Lakebase PostgreSQL Storage for Ingested Uploads
+
+Maps the SHA-256 content hash of each uploaded file to its location in the
+UC Volume so identical bytes are only uploaded once.
+"""
+
+import logging
+from datetime import datetime
+from typing import Dict, Any, Optional
+from psycopg.rows import dict_row
+from config import UPLOADS_TABLE_NAME
+from storage.lakebase_connection import get_connection_manager, ensure_simple_table
+
+logger = logging.getLogger(__name__)
+
+# CREATE TABLE column definitions
+_UPLOADS_COLUMNS = """
+    file_hash_sha256 TEXT PRIMARY KEY,
+    volume_path TEXT,
+    safe_filename TEXT,
+    size_bytes BIGINT,
+    uploaded_at TIMESTAMPTZ DEFAULT CURRENT_TIMESTAMP
+"""
+
+
+class UploadsTable:
+    """
+    Manages the content-hash -> volume path table in Lakebase PostgreSQL
+    """
+
+    def __init__(self, table_name: str = None):
+        """
+        Initialize uploads table manager
+
+        Args:
+            table_name: Table name (default from config)
+        """
+        self.table_name = table_name or UPLOADS_TABLE_NAME
+        self.conn_manager = get_connection_manager()
+        ensure_simple_table(self.conn_manager, self.table_name, _UPLOADS_COLUMNS, "uploads table")
+        logger.info(f"UploadsTable initialized: {self.table_name}")
+
+    def get_upload(self, file_hash: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up a previous upload by content hash
+
+        Args:
+            file_hash: SHA-256 hex digest of the file bytes
+
+        Returns:
+            Upload record or None if these bytes were never uploaded
+        """
+        try:
+            select_sql = f"""
+                SELECT file_hash_sha256, volume_path, safe_filename, size_bytes, uploaded_at
+                FROM {self.table_name}
+                WHERE file_hash_sha256 = %s
+            """
+
+            with self.conn_manager.connection() as conn:
+                with conn.cursor(row_factory=dict_row) as cur:
+                    cur.execute(select_sql, (file_hash,))
+                    row = cur.fetchone()
+
+            return row
+
+        except Exception as e:
+            logger.error(f"Error getting upload: {str(e)}", exc_info=True)
+            return None
+
+    def record_upload(
+        self,
+        file_hash: str,
+        volume_path: str,
+        safe_filename: str,
+        size_bytes: int
+    ) -> bool:
+        """
+        Record a completed upload
+
+        Any other hash previously pointing at the same volume path is removed,
+        since the file at that path has just been overwritten with new bytes.
+
+        Args:
+            file_hash: SHA-256 hex digest of the file bytes
+            volume_path: Path the bytes were uploaded to
+            safe_filename: Sanitized filename
+            size_bytes: File size in bytes
+
+        Returns:
+            True if successful, False otherwise
+        """
+        try:
+            delete_sql = f"""
+                DELETE FROM {self.table_name}
+                WHERE volume_path = %s AND file_hash_sha256 <> %s
+            """
+            upsert_sql = f"""
+                INSERT INTO {self.table_name}
+                (file_hash_sha256, volume_path, safe_filename, size_bytes, uploaded_at)
+                VALUES (%s, %s, %s, %s, %s)
+                ON CONFLICT (file_hash_sha256) DO UPDATE SET
+                    volume_path = EXCLUDED.volume_path,
+                    safe_filename = EXCLUDED.safe_filename,
+                    size_bytes = EXCLUDED.size_bytes,
+                    uploaded_at = EXCLUDED.uploaded_at
+            """
+
+            with self.conn_manager.connection() as conn:
+                with conn.cursor() as cur:
+                    cur.execute(delete_sql, (volume_path, file_hash))
+                    cur.execute(upsert_sql, (file_hash, volume_path, safe_filename, size_bytes, datetime.now().astimezone()))
+
+            logger.info(f"Recorded upload {file_hash[:12]} -> {volume_path}")
+            return True
+
+        except Exception as e:
+            logger.error(f"Failed to record upload: {str(e)}", exc_info=True)
+            return False
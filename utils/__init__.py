@@ -3,6 +3,7 @@ Utilities package for Unstructured ParseQuery pipeline
 """
 
 from .oauth import get_databricks_token
+from .tracing import start_span
 from .uc_logger import (
     UCVolumeLogHandler,
     PipelineLogger,
@@ -12,6 +13,7 @@ from .uc_logger import (
 
 __all__ = [
     "get_databricks_token",
+    "start_span",
     "UCVolumeLogHandler",
     "PipelineLogger",
     "setup_pipeline_logging",
@@ -7,17 +7,59 @@ with the OAuth credentials automatically injected by Databricks Apps.
 
 import os
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import logging
+from dataclasses import dataclass
 from typing import Optional
+import threading
 import time
 
 logger = logging.getLogger(__name__)
 
-# Cache for token to avoid repeated requests
-_token_cache = {
-    "token": None,
-    "expires_at": 0
-}
+
+@dataclass(frozen=True)
+class _CachedToken:
+    """Immutable token/expiry pair (expires_at is on the time.monotonic clock)"""
+    token: str
+    expires_at: float
+
+
+# Cache for token to avoid repeated requests. Replaced wholesale with a single
+# assignment, so readers never see a token paired with another token's expiry.
+_cached_token: Optional[_CachedToken] = None
+_token_lock = threading.Lock()
+
+# Shared HTTP session for the token endpoint: keeps the TLS connection to the
+# workspace alive between refreshes and retries transient errors with backoff
+# (a client-credentials token request is safe to repeat)
+_HTTP = requests.Session()
+_HTTP.mount("https://", HTTPAdapter(
+    pool_connections=2,
+    pool_maxsize=4,
+    max_retries=Retry(
+        total=3,
+        backoff_factor=0.5,
+        status_forcelist=[429, 500, 502, 503, 504],
+        allowed_methods=["POST"]
+    )
+))
+
+# Refresh tokens this many seconds before they actually expire
+_TOKEN_REFRESH_MARGIN = 300
+
+# (connect, read) timeout for the token request: the refresh holds _token_lock, so a
+# hung request would otherwise block every thread (and new Lakebase connections)
+_TOKEN_REQUEST_TIMEOUT = (5, 30)
+
+# OAuth credentials injected by Databricks Apps (fixed for the process lifetime)
+_ENV_HOST = os.environ.get("DATABRICKS_HOST")
+_ENV_CLIENT_ID = os.environ.get("DATABRICKS_CLIENT_ID")
+_ENV_CLIENT_SECRET = os.environ.get("DATABRICKS_CLIENT_SECRET")
+_HAS_OAUTH_CREDENTIALS = bool(_ENV_HOST and _ENV_CLIENT_ID and _ENV_CLIENT_SECRET)
+
+# Token endpoint (host may be injected with or without a protocol prefix)
+_TOKEN_URL = f"https://{_ENV_HOST.split('://', 1)[-1]}/oidc/v1/token" if _ENV_HOST else None
 
 # Flag to detect if we're running locally vs in Databricks Apps
 _is_local_mode = None
@@ -37,51 +79,72 @@ def get_databricks_token() -> str:
     - Falls back to using Databricks SDK with profile authentication
     - Reads credentials from ~/.databrickscfg
 
+    The token is cached process-wide and shared by every stage, the Lakebase
+    connection manager and the AI Query clients. It is only refreshed shortly
+    before expiry, and concurrent pipeline threads wait on a single refresh.
+
     Returns:
         OAuth access token
 
     Raises:
         Exception if token cannot be obtained
     """
-    global _is_local_mode
+    global _cached_token
+
+    # Fast path: cached token still valid (single reference read, no lock needed)
+    cached = _cached_token
+    if cached and time.monotonic() < cached.expires_at:
+        return cached.token
+
+    with _token_lock:
+        # Another thread may have refreshed the token while we waited for the lock
+        now = time.monotonic()
+        cached = _cached_token
+        if cached and now < cached.expires_at:
+            return cached.token
+
+        access_token, expires_in = _fetch_token()
+
+        # Cache the token (with buffer before expiration)
+        _cached_token = _CachedToken(
+            token=access_token,
+            expires_at=now + max(expires_in - _TOKEN_REFRESH_MARGIN, 60)
+        )
+        return access_token
 
-    # Check if we have a cached valid token
-    current_time = time.time()
-    if _token_cache["token"] and _token_cache["expires_at"] > current_time:
-        logger.debug("Using cached OAuth token")
-        return _token_cache["token"]
 
-    # Get OAuth credentials from environment
-    host = os.environ.get("DATABRICKS_HOST")
-    client_id = os.environ.get("DATABRICKS_CLIENT_ID")
-    client_secret = os.environ.get("DATABRICKS_CLIENT_SECRET")
+def _fetch_token():
+    """
+    Fetch a fresh token, using client credentials in Apps or the SDK profile locally.
+
+    Returns:
+        Tuple of (access token, lifetime in seconds)
+    """
+    global _is_local_mode
 
     # Check if we're running locally (no OAuth credentials)
-    if not all([host, client_id, client_secret]):
+    if not _HAS_OAUTH_CREDENTIALS:
         if _is_local_mode is None:
             _is_local_mode = True
             logger.info("OAuth credentials not available - using local profile authentication")
-        return _get_token_from_sdk_profile()
+        # We don't know the exact expiry of profile tokens, assume 1 hour
+        return _get_token_from_sdk_profile(), 3600
 
-    # Ensure host doesn't have protocol
-    if host.startswith("http://") or host.startswith("https://"):
-        host = host.split("://")[1]
-
-    # Construct token endpoint
-    token_url = f"https://{host}/oidc/v1/token"
+    token_url = _TOKEN_URL
 
     logger.info(f"Requesting OAuth token from {token_url}")
 
     # Request token using client credentials flow
     try:
-        response = requests.post(
+        response = _HTTP.post(
             token_url,
             data={
                 "grant_type": "client_credentials",
                 "scope": "all-apis"
             },
-            auth=(client_id, client_secret),
-            headers={"Content-Type": "application/x-www-form-urlencoded"}
+            auth=(_ENV_CLIENT_ID, _ENV_CLIENT_SECRET),
+            headers={"Content-Type": "application/x-www-form-urlencoded"},
+            timeout=_TOKEN_REQUEST_TIMEOUT
         )
 
         response.raise_for_status()
@@ -93,12 +156,8 @@ def get_databricks_token() -> str:
         if not access_token:
             raise Exception("No access_token in OAuth response")
 
-        # Cache the token (with 5 minute buffer before expiration)
-        _token_cache["token"] = access_token
-        _token_cache["expires_at"] = current_time + expires_in - 300
-
         logger.info(f"Successfully obtained OAuth token (expires in {expires_in}s)")
-        return access_token
+        return access_token, expires_in
 
     except requests.exceptions.RequestException as e:
         logger.error(f"Failed to obtain OAuth token: {str(e)}", exc_info=True)
@@ -107,10 +166,11 @@ def get_databricks_token() -> str:
 
 def _get_token_from_sdk_profile() -> str:
     """
-    Get Databricks token using Databricks CLI with profile authentication (for local testing).
+    Get Databricks token in-process from the SDK's profile authentication (for local testing).
 
-    Uses `databricks auth token` command which handles profile-based authentication
-    from ~/.databrickscfg.
+    The SDK resolves credentials from ~/.databrickscfg (DATABRICKS_CONFIG_PROFILE,
+    default "DEFAULT") and produces the Authorization header directly, without
+    spawning the `databricks` CLI.
 
     Returns:
         Access token from profile authentication
@@ -119,45 +179,26 @@ def _get_token_from_sdk_profile() -> str:
         Exception if token cannot be obtained
     """
     try:
-        import subprocess
-        import json as json_module
         from databricks.sdk import WorkspaceClient
 
-        # Get the profile name and host
         profile = os.environ.get("DATABRICKS_CONFIG_PROFILE", "DEFAULT")
-
-        # Use SDK to get the host from the profile
         w = WorkspaceClient()
-        host = w.config.host
-
-        logger.info(f"Getting token from Databricks CLI for profile: {profile}, host: {host}")
 
-        # Use databricks CLI to get token
-        cmd = ["databricks", "auth", "token", "--host", host, "--profile", profile]
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
-
-        if result.returncode != 0:
-            raise Exception(f"databricks auth token failed: {result.stderr}")
-
-        # Parse JSON response
-        token_data = json_module.loads(result.stdout)
-        access_token = token_data.get("access_token")
-
-        if not access_token:
-            raise Exception("No access_token in CLI response")
+        logger.info(f"Getting token from Databricks SDK for profile: {profile}, host: {w.config.host}")
 
-        logger.info("Successfully obtained token from Databricks CLI")
+        # authenticate() returns the request headers, e.g. {"Authorization": "Bearer <token>"}
+        auth_header = w.config.authenticate().get("Authorization", "")
+        scheme, _, access_token = auth_header.partition(" ")
 
-        # Cache the token (set expiry to 1 hour as we don't know exact expiry)
-        current_time = time.time()
-        _token_cache["token"] = access_token
-        _token_cache["expires_at"] = current_time + 3600 - 300  # 1 hour minus 5 min buffer
+        if scheme != "Bearer" or not access_token:
+            raise Exception("No bearer token in SDK authentication headers")
 
+        logger.info("Successfully obtained token from Databricks SDK")
         return access_token
 
     except Exception as e:
-        logger.error(f"Failed to obtain token from Databricks CLI: {str(e)}", exc_info=True)
-        raise Exception(f"Databricks CLI authentication failed: {str(e)}")
+        logger.error(f"Failed to obtain token from Databricks SDK: {str(e)}", exc_info=True)
+        raise Exception(f"Databricks profile authentication failed: {str(e)}")
 
 
 def get_user_token_from_streamlit_context() -> Optional[str]:
@@ -0,0 +1,51 @@
+"""
+MLflow tracing helpers for pipeline stages
+
+Stage spans are opened through start_span() so per-stage tracing can be
+switched off (MLFLOW_TRACING=0) for bulk runs. When disabled, stages receive a
+no-op span and MLflow never serializes their inputs, outputs or attributes.
+"""
+
+from contextlib import contextmanager
+import mlflow
+from config import MLFLOW_TRACING_ENABLED
+
+
+class _NullSpan:
+    """Stand-in for an MLflow span when stage tracing is disabled"""
+
+    request_id = None
+    span_id = None
+
+    def set_inputs(self, inputs):
+        pass
+
+    def set_outputs(self, outputs):
+        pass
+
+    def set_attribute(self, key, value):
+        pass
+
+    def set_attributes(self, attributes):
+        pass
+
+
+_NULL_SPAN = _NullSpan()
+
+
+@contextmanager
+def start_span(name: str, span_type: str = None, attributes: dict = None):
+    """
+    Open an MLflow span, or yield a no-op span when stage tracing is disabled
+
+    Args:
+        name: Span name
+        span_type: MLflow span type (e.g. "LLM", "PARSER")
+        attributes: Initial span attributes
+    """
+    if not MLFLOW_TRACING_ENABLED:
+        yield _NULL_SPAN
+        return
+
+    with mlflow.start_span(name=name, span_type=span_type, attributes=attributes) as span:
+        yield span
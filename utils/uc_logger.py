@@ -4,16 +4,172 @@ UC Volume Logger
 Custom logging handler that writes pipeline logs to UC Volume.
 Each pipeline gets its own log file in JSON lines format.
 
+One process-wide router captures records for every running pipeline: records are
+tagged with the pipeline bound to the logging thread's context, queued, and
+routed by a single listener thread to that pipeline's buffer; a single flusher
+thread uploads all pipelines' buffers in one pass.
+
 Uses Databricks SDK Files API for volume operations (required for Databricks Apps
 since FUSE-mounted volumes are not supported).
 """
 
+import gzip
 import logging
+import logging.handlers
 import io
+import os
+import queue
+import tempfile
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import ContextVar
 from datetime import datetime
 from typing import Optional
 from databricks.sdk import WorkspaceClient
-from config import LOGS_VOLUME_PATH
+from config import (
+    LOGS_VOLUME_PATH,
+    UC_LOG_BATCH_BYTES,
+    UC_LOG_BATCH_RECORDS,
+    UC_LOG_BATCH_MS,
+    UC_LOG_RING_MAX,
+    UC_LOG_QUEUE_MAX,
+    UC_LOG_GZIP,
+    UC_LOG_EXTENSION
+)
+
+
+# Identical consecutive records within this many seconds are counted, not stored
+_REPEAT_WINDOW_S = 1.0
+
+# The Files API has no append, so every upload rewrites the whole file. Once the
+# file is large, a periodic flush only re-uploads when the new bytes are at least
+# this fraction of the file, or the last upload is older than _MAX_UPLOAD_DELAY_S
+_MIN_REUPLOAD_FRACTION = 0.1
+_MAX_UPLOAD_DELAY_S = 30.0
+
+# Upload attempts per flush, with exponential backoff between them (0.25s, 0.5s, 1s, 2s)
+_UPLOAD_ATTEMPTS = 5
+_UPLOAD_BACKOFF_BASE_S = 0.25
+_UPLOAD_BACKOFF_MAX_S = 4.0
+
+# WorkspaceClient shared by all handlers in the process (one config/auth load and
+# one HTTP connection pool reused across pipelines)
+_WS_CLIENT: Optional[WorkspaceClient] = None
+_WS_CLIENT_LOCK = threading.Lock()
+
+# Log directories known to exist (created, or found existing, earlier in this process)
+_CREATED_DIRS = set()
+_CREATED_DIRS_LOCK = threading.Lock()
+
+# Pipeline whose log file receives records logged in the current thread/context
+_current_pipeline_id: ContextVar[Optional[str]] = ContextVar("uc_log_pipeline_id", default=None)
+
+# Concurrent per-file uploads in one flush pass of the shared flusher
+_FLUSH_WORKERS = 4
+# Max seconds cleanup waits for a pipeline's queued records to be routed
+_DRAIN_TIMEOUT_S = 5.0
+
+
+class PipelineLogFormatter(logging.Formatter):
+    """
+    Formats records as "asctime - name - levelname - message" with one f-string,
+    bypassing the %-style template substitution of logging.Formatter. The
+    per-second part of the timestamp and the " - name - levelname - " segment of
+    each logger/level pair are built once and reused.
+    """
+
+    def __init__(self):
+        super().__init__()
+        # (second, "YYYY-mm-dd HH:MM:SS") of the last formatted record: records in
+        # the same second reuse the string instead of calling localtime/strftime
+        self._last_sec = (-1, "")
+        # (logger name, level name) -> " - name - levelname - "
+        self._segments = {}
+
+    def formatTime(self, record: logging.LogRecord, datefmt: str = None) -> str:
+        if datefmt:
+            return super().formatTime(record, datefmt)
+
+        sec = int(record.created)
+        cached_sec, sec_str = self._last_sec
+        if sec != cached_sec:
+            sec_str = time.strftime(self.default_time_format, self.converter(sec))
+            self._last_sec = (sec, sec_str)
+        return f"{sec_str},{int(record.msecs):03d}"
+
+    def format(self, record: logging.LogRecord) -> str:
+        key = (record.name, record.levelname)
+        segment = self._segments.get(key)
+        if segment is None:
+            segment = self._segments[key] = f" - {record.name} - {record.levelname} - "
+        line = self.formatTime(record) + segment + record.getMessage()
+
+        # Same exception/stack handling as logging.Formatter
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            line = f"{line}\n{record.exc_text}"
+        if record.stack_info:
+            line = f"{line}\n{self.formatStack(record.stack_info)}"
+        return line
+
+
+class _ExcludeLoggersFilter(logging.Filter):
+    """
+    Rejects records from the SDK/HTTP client loggers. The log uploads themselves
+    go through these loggers, so capturing them would feed every upload's own
+    logging back into the buffer (and grow it during a Files API stall).
+    """
+
+    _EXCLUDED_PREFIXES = ("databricks", "urllib3")
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        name = record.name
+        return not any(
+            name == prefix or name.startswith(prefix + ".")
+            for prefix in self._EXCLUDED_PREFIXES
+        )
+
+
+class DroppingQueueHandler(logging.handlers.QueueHandler):
+    """
+    QueueHandler for a bounded queue: records that don't fit are dropped and
+    counted instead of blocking (or growing memory in) the logging thread.
+
+    Only records logged while a pipeline is bound to the current context are
+    queued; each is tagged with that pipeline_id for routing.
+    """
+
+    def __init__(self, log_queue: queue.Queue):
+        super().__init__(log_queue)
+        # pipeline_id -> records dropped since the last take_dropped()
+        self._dropped = {}
+        self._dropped_lock = threading.Lock()
+
+    def emit(self, record: logging.LogRecord):
+        pipeline_id = _current_pipeline_id.get()
+        if pipeline_id is None:
+            return
+        try:
+            record = self.prepare(record)
+            record.pipeline_id = pipeline_id
+            self.enqueue(record)
+        except Exception:
+            self.handleError(record)
+
+    def enqueue(self, record: logging.LogRecord):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            with self._dropped_lock:
+                self._dropped[record.pipeline_id] = self._dropped.get(record.pipeline_id, 0) + 1
+
+    def take_dropped(self, pipeline_id: str) -> int:
+        """Return and reset the number of a pipeline's records dropped since the last call."""
+        with self._dropped_lock:
+            return self._dropped.pop(pipeline_id, 0)
 
 
 class UCVolumeLogHandler(logging.Handler):
@@ -21,6 +177,19 @@ class UCVolumeLogHandler(logging.Handler):
     Custom logging handler that writes to UC Volume.
     Creates a separate log file per pipeline_id in JSON lines format.
     Uses Databricks SDK Files API instead of direct file I/O.
+
+    Records are routed here by the shared pipeline log router and uploaded in
+    batches by its flusher thread, every UC_LOG_BATCH_MS or sooner once the
+    buffer reaches UC_LOG_BATCH_BYTES / UC_LOG_BATCH_RECORDS. emit() only appends
+    under a short lock; a flush snapshots the buffer and uploads the snapshot
+    while new records keep arriving.
+
+    Consecutive identical records (same logger, level and message) within
+    _REPEAT_WINDOW_S of the first are counted instead of stored, and written as
+    one "Last message repeated N times" line.
+
+    At most UC_LOG_RING_MAX records are kept: on overflow the oldest records are
+    dropped (in chunks of 10%) and the file starts with a dropped-records marker.
     """
 
     def __init__(self, pipeline_id: str, level=logging.DEBUG):
@@ -34,16 +203,48 @@ class UCVolumeLogHandler(logging.Handler):
         super().__init__(level)
         self.pipeline_id = pipeline_id
         self.logs_base_path = LOGS_VOLUME_PATH
-        self.log_buffer = []
+        # Encoded log file content. Each upload rewrites the whole file, so this
+        # holds everything written so far. Lines are appended already encoded, so
+        # a flush never builds a joined string or a second encoded copy.
+        self._buf = bytearray()
+        # Bytes ever appended / included in the last successful upload
+        self._appended_bytes = 0
+        self._uploaded_bytes = 0
+        self._last_upload_ts = time.monotonic()
+        self._records_in_buffer = 0
+        # Guards the buffer state (held only for appends and snapshots)
+        self._swap_lock = threading.Lock()
+        # Serializes uploads (flusher thread and the final flush on close)
+        self._upload_lock = threading.Lock()
+        # Byte length of every kept record, oldest first (for dropping on overflow)
+        self._record_sizes = deque()
+        self._max_records = max(UC_LOG_RING_MAX, 1)
+        self._dropped_records = 0
+        # Consecutive-repeat suppression: last stored record's key/time and the
+        # number of identical records counted since
+        self._repeat_key = None
+        self._repeat_start = 0.0
+        self._repeat_record = None
+        self._repeat_count = 0
+        # Batch thresholds
+        self._max_buffer_bytes = UC_LOG_BATCH_BYTES
+        self._max_buffer_records = UC_LOG_BATCH_RECORDS
+        # Shared flusher's wake-up event (set when registered with the router)
+        self._flush_requested: Optional[threading.Event] = None
+        # Context binding made by setup_pipeline_logging (reset on cleanup)
+        self._context_token = None
         self.file_path = None
-        self._workspace_client = None
+        self.addFilter(_ExcludeLoggersFilter())
         self._setup_log_file()
 
     def _get_workspace_client(self) -> WorkspaceClient:
-        """Get or create WorkspaceClient instance."""
-        if self._workspace_client is None:
-            self._workspace_client = WorkspaceClient()
-        return self._workspace_client
+        """Get or create the process-wide WorkspaceClient instance."""
+        global _WS_CLIENT
+        if _WS_CLIENT is None:
+            with _WS_CLIENT_LOCK:
+                if _WS_CLIENT is None:
+                    _WS_CLIENT = WorkspaceClient()
+        return _WS_CLIENT
 
     def _setup_log_file(self):
         """Set up the log file path and create directories if needed."""
@@ -51,21 +252,28 @@ class UCVolumeLogHandler(logging.Handler):
         date_str = datetime.now().strftime("%Y-%m-%d")
         log_dir = f"{self.logs_base_path}/{date_str}"
 
-        # Log file path: {base_path}/{date}/{pipeline_id}.log
-        self.file_path = f"{log_dir}/{self.pipeline_id}.log"
-
-        # Create directory using SDK Files API
-        try:
-            w = self._get_workspace_client()
-            w.files.create_directory(log_dir)
-        except Exception as e:
-            # Directory might already exist, or we might not have permissions
-            # Log to stderr but continue - we'll handle errors during flush
-            import sys
-            # Only warn if it's not an "already exists" error
-            error_str = str(e).lower()
-            if "already exists" not in error_str and "resource already exists" not in error_str:
-                print(f"Warning: Could not create log directory {log_dir}: {e}", file=sys.stderr)
+        # Log file path: {base_path}/{date}/{pipeline_id}.log (.log.gz when UC_LOG_GZIP)
+        self.file_path = f"{log_dir}/{self.pipeline_id}{UC_LOG_EXTENSION}"
+
+        # Create directory using SDK Files API (once per date per process)
+        with _CREATED_DIRS_LOCK:
+            if log_dir in _CREATED_DIRS:
+                return
+
+            try:
+                w = self._get_workspace_client()
+                w.files.create_directory(log_dir)
+                _CREATED_DIRS.add(log_dir)
+            except Exception as e:
+                # Directory might already exist, or we might not have permissions
+                # Log to stderr but continue - we'll handle errors during flush
+                import sys
+                # Only warn if it's not an "already exists" error
+                error_str = str(e).lower()
+                if "already exists" in error_str or "resource already exists" in error_str:
+                    _CREATED_DIRS.add(log_dir)
+                else:
+                    print(f"Warning: Could not create log directory {log_dir}: {e}", file=sys.stderr)
 
     def emit(self, record: logging.LogRecord):
         """
@@ -75,52 +283,315 @@ class UCVolumeLogHandler(logging.Handler):
             record: The log record to emit
         """
         try:
+            # QueueHandler.prepare() has already merged args and exception text into msg
+            key = (record.name, record.levelno, record.msg if not record.args else record.getMessage())
+            if key == self._repeat_key and record.created - self._repeat_start < _REPEAT_WINDOW_S:
+                self._repeat_count += 1
+                self._repeat_record = record
+                return
+
+            self._write_repeat_summary()
+            self._repeat_key = key
+            self._repeat_start = record.created
+
             # Format the log entry as plain text
             # self.format() already includes exception info via the formatter
-            log_line = self.format(record)
-
-            # Add to buffer
-            self.log_buffer.append(log_line)
+            self._append_line(self.format(record))
 
         except Exception:
             self.handleError(record)
 
-    def flush(self):
-        """Flush buffered logs to UC Volume using SDK Files API."""
-        if not self.log_buffer or not self.file_path:
+    def _write_repeat_summary(self):
+        """Write the pending "Last message repeated N times" line, if any."""
+        if not self._repeat_count:
             return
 
-        try:
-            # Convert buffer to plain text (one log entry per line)
-            content = '\n'.join(self.log_buffer) + '\n'
-
-            # Upload using SDK Files API
-            w = self._get_workspace_client()
-            w.files.upload(
-                file_path=self.file_path,
-                contents=io.BytesIO(content.encode('utf-8')),
-                overwrite=True  # Overwrite if file exists (shouldn't happen with unique pipeline IDs)
+        last = self._repeat_record
+        self._append_line(self.format(logging.makeLogRecord({
+            "name": last.name,
+            "levelno": last.levelno,
+            "levelname": last.levelname,
+            "created": last.created,
+            "msecs": last.msecs,
+            "msg": f"Last message repeated {self._repeat_count} times"
+        })))
+        self._repeat_count = 0
+        self._repeat_record = None
+
+    def _append_line(self, log_line: str):
+        """Append one formatted line to the buffer, waking the flusher if the batch is full."""
+        encoded = log_line.encode('utf-8')
+
+        # Add to buffer
+        with self._swap_lock:
+            self._buf += encoded
+            self._buf += b'\n'
+            self._record_sizes.append(len(encoded) + 1)
+            self._appended_bytes += len(encoded) + 1
+            self._records_in_buffer += 1
+
+            if len(self._record_sizes) > self._max_records:
+                self._drop_oldest()
+
+            batch_full = (
+                self._appended_bytes - self._uploaded_bytes >= self._max_buffer_bytes
+                or self._records_in_buffer >= self._max_buffer_records
             )
 
-            # Clear buffer after successful upload
-            self.log_buffer = []
+        if batch_full and self._flush_requested is not None:
+            # Wake the flusher early instead of waiting for the interval
+            self._flush_requested.set()
+
+    def _drop_oldest(self):
+        """Drop the oldest records, down to 90% of the cap, in a single buffer move."""
+        keep = self._max_records - self._max_records // 10
+        drop_count = len(self._record_sizes) - keep
+        drop_bytes = 0
+        for _ in range(drop_count):
+            drop_bytes += self._record_sizes.popleft()
+
+        del self._buf[:drop_bytes]
+        self._dropped_records += drop_count
+        # Dropped records may include some not yet uploaded
+        self._records_in_buffer = min(self._records_in_buffer, len(self._record_sizes))
+
+    def record_queue_drops(self, dropped: int):
+        """Write a marker record for records dropped before reaching this handler (queue full)."""
+        if dropped:
+            self.handle(logging.makeLogRecord({
+                "name": __name__,
+                "levelno": logging.WARNING,
+                "levelname": "WARNING",
+                "msg": f"Dropped {dropped} log records (log queue full, UC_LOG_QUEUE_MAX={UC_LOG_QUEUE_MAX})"
+            }))
+
+    def flush(self, final: bool = False):
+        """
+        Flush buffered logs to UC Volume using SDK Files API.
+
+        Transient upload errors are retried with exponential backoff. If all
+        attempts fail the buffer is kept for the next flush; on the final flush
+        (close) the content is written to a local fallback file instead.
+
+        Args:
+            final: Last flush for this handler (no later flush will retry)
+        """
+        if not self.file_path:
+            return
+
+        with self._upload_lock:
+            # Snapshot the buffer; emit() keeps appending to the live buffer during the upload
+            with self._swap_lock:
+                new_bytes = self._appended_bytes - self._uploaded_bytes
+                if new_bytes == 0:
+                    return
+                if (
+                    not final
+                    and new_bytes < self._max_buffer_bytes
+                    and self._records_in_buffer < self._max_buffer_records
+                    and new_bytes < _MIN_REUPLOAD_FRACTION * len(self._buf)
+                    and time.monotonic() - self._last_upload_ts < _MAX_UPLOAD_DELAY_S
+                ):
+                    # Small delta on a large file: wait rather than re-send the whole file
+                    return
+                snapshot_bytes = self._appended_bytes
+                content = bytes(self._buf)
+                dropped_records = self._dropped_records
+                self._records_in_buffer = 0
+
+            # Plain text, one log entry per line
+            if dropped_records:
+                marker = f"... {dropped_records} earlier log records dropped (UC_LOG_RING_MAX={self._max_records}) ...\n"
+                content = marker.encode('utf-8') + content
+            if UC_LOG_GZIP:
+                # Level 1: most of the size reduction on repetitive log text at minimal CPU
+                content = gzip.compress(content, compresslevel=1, mtime=0)
+
+            for attempt in range(_UPLOAD_ATTEMPTS):
+                try:
+                    self._upload(content)
+                    # Mark snapshot as uploaded after successful upload
+                    self._uploaded_bytes = snapshot_bytes
+                    self._last_upload_ts = time.monotonic()
+                    return
+                except Exception as e:
+                    last_error = e
+                    if attempt < _UPLOAD_ATTEMPTS - 1:
+                        time.sleep(min(_UPLOAD_BACKOFF_BASE_S * 2 ** attempt, _UPLOAD_BACKOFF_MAX_S))
 
-        except Exception as e:
             import sys
-            print(f"Error flushing logs to {self.file_path}: {e}", file=sys.stderr)
-            # Clear buffer anyway to avoid memory buildup
-            self.log_buffer = []
+            print(
+                f"Error flushing logs to {self.file_path} after {_UPLOAD_ATTEMPTS} attempts: {last_error}",
+                file=sys.stderr
+            )
+            if final:
+                self._write_fallback(content)
+
+    def _upload(self, content: bytes):
+        """Upload the complete log file content, replacing the previous upload."""
+        w = self._get_workspace_client()
+        # Stream passed positionally: the parameter is `contents` in FilesAPI but
+        # `content` in the FilesExt wrapper of some SDK releases
+        w.files.upload(
+            self.file_path,
+            io.BytesIO(content),
+            overwrite=True  # Replaces the previous flush's (shorter) file
+        )
+
+    def _write_fallback(self, content: bytes):
+        """Write log content that could not be uploaded to a local file."""
+        import sys
+        fallback_path = os.path.join(tempfile.gettempdir(), f"uc_log_fallback_{self.pipeline_id}{UC_LOG_EXTENSION}")
+        try:
+            with open(fallback_path, "wb") as f:
+                f.write(content)
+            print(f"Wrote pipeline logs to local fallback file {fallback_path}", file=sys.stderr)
+        except OSError as e:
+            print(f"Could not write fallback log file {fallback_path}: {e}", file=sys.stderr)
 
     def close(self):
         """Close the handler, flushing any remaining logs."""
-        self.flush()
+        with self.lock:
+            self._write_repeat_summary()
+        self.flush(final=True)
         super().close()
 
 
+class _PipelineLogRouter(logging.Handler):
+    """
+    Process-wide pipeline log capture shared by all running pipelines.
+
+    A single DroppingQueueHandler on the root logger queues records tagged with
+    their pipeline_id; one QueueListener thread routes them (via this handler's
+    emit) to the registered UCVolumeLogHandler, and one flusher thread uploads
+    all registered handlers' buffers per pass, using a small thread pool. The
+    threads and queue are started on first use.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._handlers = {}
+        self._handlers_lock = threading.Lock()
+        self._started = False
+        self._queue = None
+        self.queue_handler = None
+        self._listener = None
+        self._flush_requested = threading.Event()
+        self._flush_interval_s = UC_LOG_BATCH_MS / 1000
+        self._executor = None
+
+    def _ensure_started(self):
+        """Start the queue, listener and flusher threads, and attach to the root logger."""
+        if self._started:
+            return
+
+        self._queue = queue.Queue(maxsize=max(UC_LOG_QUEUE_MAX, 1))
+        self.queue_handler = DroppingQueueHandler(self._queue)
+        # Filter before queueing too, so excluded records never take queue slots
+        self.queue_handler.addFilter(_ExcludeLoggersFilter())
+        self._listener = logging.handlers.QueueListener(self._queue, self, respect_handler_level=True)
+        self._listener.start()
+
+        self._executor = ThreadPoolExecutor(max_workers=_FLUSH_WORKERS, thread_name_prefix="uc-log-upload")
+        threading.Thread(target=self._flush_loop, name="uc-log-flusher", daemon=True).start()
+
+        # Module loggers propagate to the root logger
+        logging.getLogger().addHandler(self.queue_handler)
+
+        self._started = True
+
+    def close(self):
+        """Detach the queue handler from the root logger (logging shutdown)."""
+        if self.queue_handler is not None:
+            logging.getLogger().removeHandler(self.queue_handler)
+        super().close()
+
+    def register(self, handler: UCVolumeLogHandler):
+        """Start routing records of handler.pipeline_id to the handler."""
+        with self._handlers_lock:
+            self._ensure_started()
+            handler._flush_requested = self._flush_requested
+            self._handlers[handler.pipeline_id] = handler
+
+    def unregister(self, handler: UCVolumeLogHandler):
+        """Stop routing records to the handler (it is no longer flushed by the router)."""
+        with self._handlers_lock:
+            if self._handlers.get(handler.pipeline_id) is handler:
+                del self._handlers[handler.pipeline_id]
+        self._record_queue_drops(handler)
+
+    def drain(self, timeout: float = _DRAIN_TIMEOUT_S):
+        """Wait until every record queued before this call has been routed."""
+        if not self._started:
+            return
+        drained = threading.Event()
+        barrier = logging.makeLogRecord({
+            "name": __name__,
+            "levelno": logging.CRITICAL,
+            "levelname": "CRITICAL",
+            "drain_event": drained
+        })
+        try:
+            self._queue.put(barrier, timeout=timeout)
+        except queue.Full:
+            return
+        drained.wait(timeout)
+
+    def emit(self, record: logging.LogRecord):
+        """Route a queued record to its pipeline's handler (listener thread)."""
+        drained = getattr(record, "drain_event", None)
+        if drained is not None:
+            drained.set()
+            return
+
+        handler = self._handlers.get(getattr(record, "pipeline_id", None))
+        # Handler.handle() applies filters but not the level (callHandlers normally does)
+        if handler is not None and record.levelno >= handler.level:
+            handler.handle(record)
+
+    def _record_queue_drops(self, handler: UCVolumeLogHandler):
+        """Write the queue-full drop marker for a handler, if it lost records."""
+        if self.queue_handler is not None:
+            handler.record_queue_drops(self.queue_handler.take_dropped(handler.pipeline_id))
+
+    def _flush_loop(self):
+        """Flusher thread: every flush interval (or early when a batch fills up), flush all pipelines."""
+        while True:
+            self._flush_requested.wait(self._flush_interval_s)
+            self._flush_requested.clear()
+            try:
+                self._flush_all()
+            except Exception as e:
+                import sys
+                print(f"Error flushing pipeline logs: {e}", file=sys.stderr)
+
+    def _flush_all(self):
+        """Upload every registered pipeline's new log content in one pass."""
+        with self._handlers_lock:
+            handlers = list(self._handlers.values())
+        if not handlers:
+            return
+
+        for handler in handlers:
+            self._record_queue_drops(handler)
+
+        if len(handlers) == 1:
+            handlers[0].flush()
+        else:
+            # Files are independent: upload them concurrently
+            list(self._executor.map(lambda h: h.flush(), handlers))
+
+
+# Shared by every pipeline in the process
+_ROUTER = _PipelineLogRouter()
+
+
 class PipelineLogger:
     """
     Context manager for pipeline-specific logging to UC Volume.
 
+    Records logged in the entering thread (until exit) go to the pipeline's log file.
+
     Usage:
         with PipelineLogger(pipeline_id) as logger:
             logger.info("Processing started")
@@ -139,49 +610,16 @@ class PipelineLogger:
         self.pipeline_id = pipeline_id
         self.level = level
         self.handler = None
-        self.loggers = []
 
     def __enter__(self):
         """Set up logging handler for the pipeline."""
-        # Create the UC Volume handler
-        self.handler = UCVolumeLogHandler(self.pipeline_id, self.level)
-
-        # Set formatter
-        formatter = logging.Formatter(
-            '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-        )
-        self.handler.setFormatter(formatter)
-
-        # Add handler to root logger and key module loggers
-        loggers_to_capture = [
-            '',  # Root logger
-            'backend',
-            'stages.ingest',
-            'stages.parse',
-            'stages.categorize',
-            'stages.extract',
-            'stages.deidentify',
-            'storage.status_table',
-            'storage.results_table'
-        ]
-
-        for logger_name in loggers_to_capture:
-            logger = logging.getLogger(logger_name)
-            logger.addHandler(self.handler)
-            self.loggers.append(logger)
-
+        self.handler = setup_pipeline_logging(self.pipeline_id, self.level)
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         """Clean up logging handler."""
-        # Flush and close the handler
-        if self.handler:
-            self.handler.close()
-
-            # Remove handler from all loggers
-            for logger in self.loggers:
-                logger.removeHandler(self.handler)
-
+        # Drain queued records, flush and close the handler
+        cleanup_pipeline_logging(self.handler)
         return False  # Don't suppress exceptions
 
     def get_log_path(self) -> Optional[str]:
@@ -189,31 +627,29 @@ class PipelineLogger:
         return self.handler.file_path if self.handler else None
 
 
-def setup_pipeline_logging(pipeline_id: str) -> UCVolumeLogHandler:
+def setup_pipeline_logging(pipeline_id: str, level=logging.DEBUG) -> UCVolumeLogHandler:
     """
     Set up logging for a pipeline run.
 
     This is a simpler alternative to the context manager for cases
-    where you need more control.
+    where you need more control. Records logged by the calling thread (its
+    context) until cleanup_pipeline_logging are written to the pipeline's file.
 
     Args:
         pipeline_id: Unique identifier for the pipeline run
+        level: Minimum logging level to capture
 
     Returns:
-        The UCVolumeLogHandler instance (caller must call close() when done)
+        The UCVolumeLogHandler instance (pass to cleanup_pipeline_logging when done)
     """
-    handler = UCVolumeLogHandler(pipeline_id)
+    handler = UCVolumeLogHandler(pipeline_id, level)
 
     # Set formatter
-    formatter = logging.Formatter(
-        '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-    )
-    handler.setFormatter(formatter)
+    handler.setFormatter(PipelineLogFormatter())
 
-    # Add handler to root logger only
-    # Module loggers will propagate to root logger
-    root_logger = logging.getLogger()
-    root_logger.addHandler(handler)
+    # Route this context's records to the handler (uploads run on the shared flusher)
+    _ROUTER.register(handler)
+    handler._context_token = _current_pipeline_id.set(pipeline_id)
 
     return handler
 
@@ -226,6 +662,14 @@ def cleanup_pipeline_logging(handler: UCVolumeLogHandler):
         handler: The handler returned by setup_pipeline_logging
     """
     if handler:
+        # Unbind first so no more records are tagged for this pipeline
+        try:
+            _current_pipeline_id.reset(handler._context_token)
+        except (ValueError, TypeError):
+            # Called from another context than setup: just clear the binding there
+            _current_pipeline_id.set(None)
+
+        # Route everything already queued, then do the final flush
+        _ROUTER.drain()
+        _ROUTER.unregister(handler)
         handler.close()
-        root_logger = logging.getLogger()
-        root_logger.removeHandler(handler)